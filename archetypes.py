@@ -0,0 +1,83 @@
+import bisect
+from config import GameConfig
+
+config = GameConfig()
+
+
+class Archetype:
+    __slots__ = ("type_id", "name", "color", "speed", "movement", "strength", "heal", "spawn_prob")
+    
+    def __init__(self, type_id, name, color, speed, movement, strength, heal, spawn_prob):
+        self.type_id = type_id
+        self.name = name
+        self.color = color
+        self.speed = speed
+        self.movement = movement
+        self.strength = strength
+        self.heal = heal
+        self.spawn_prob = spawn_prob
+    
+    @property
+    def tracks(self):
+        return self.movement == "track"
+
+
+class ArchetypeRegistry:
+    def __init__(self, definitions=None, strengths=None, heals=None):
+        definitions = config.enemy.ARCHETYPES if definitions is None else definitions
+        strengths = config.collision.STRENGTH if strengths is None else strengths
+        heals = config.collision.HEAL if heals is None else heals
+        
+        self.archetypes = []
+        self.by_name = {}
+        self.by_color = {}
+        
+        for definition in definitions:
+            name = definition["name"]
+            archetype = Archetype(
+                len(self.archetypes),
+                name,
+                tuple(definition["color"]),
+                definition["speed"],
+                definition["movement"],
+                strengths.get(name, 0),
+                heals.get(name, 0),
+                definition["spawn_prob"]
+            )
+            self.archetypes.append(archetype)
+            self.by_name[name] = archetype
+            self.by_color[archetype.color] = archetype
+        
+        self.colors = [archetype.color for archetype in self.archetypes]
+        self.heal_table = [archetype.heal for archetype in self.archetypes]
+        self.tracking_table = [archetype.tracks for archetype in self.archetypes]
+        self.strength_table = [
+            [(a.strength > b.strength) - (a.strength < b.strength) for b in self.archetypes]
+            for a in self.archetypes
+        ]
+        
+        self.spawn_thresholds = []
+        cumulative = 0.0
+        for archetype in self.archetypes[:-1]:
+            cumulative += archetype.spawn_prob
+            self.spawn_thresholds.append(cumulative)
+    
+    def __len__(self):
+        return len(self.archetypes)
+    
+    def __getitem__(self, type_id):
+        return self.archetypes[type_id]
+    
+    def type_id_of(self, name):
+        archetype = self.by_name.get(name)
+        return None if archetype is None else archetype.type_id
+    
+    def type_id_for_color(self, color):
+        archetype = self.by_color.get(tuple(color))
+        return None if archetype is None else archetype.type_id
+    
+    def pick(self, rng):
+        return self.archetypes[bisect.bisect_right(self.spawn_thresholds, rng.random())]
+    
+    def compare(self, type1, type2):
+        return self.strength_table[type1][type2]
@@ -0,0 +1,102 @@
+import pygame
+import logging
+from config import GameConfig
+
+config = GameConfig()
+
+
+class AssetCache:
+    _instance = None
+    
+    def __init__(self):
+        self.surfaces = {}
+        self.images = {}
+        self.hits = 0
+        self.misses = 0
+    
+    @classmethod
+    def get(cls):
+        if not cls._instance:
+            cls._instance = AssetCache()
+        return cls._instance
+    
+    def _convert(self, surface, alpha=False):
+        if pygame.display.get_surface() is None:
+            return surface
+        
+        try:
+            return surface.convert_alpha() if alpha else surface.convert()
+        except pygame.error as e:
+            logging.warning("Failed to convert surface: {}".format(e))
+            return surface
+    
+    def _lookup(self, key):
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return surface
+    
+    def get_solid(self, color, size):
+        key = ("solid", tuple(color), size)
+        surface = self._lookup(key)
+        if surface is None:
+            surface = pygame.Surface(size)
+            surface.fill(color)
+            surface = self._convert(surface)
+            self.surfaces[key] = surface
+        return surface
+    
+    def load_image(self, path):
+        if path in self.images:
+            return self.images[path]
+        
+        try:
+            image = pygame.image.load(path)
+        except (pygame.error, IOError) as e:
+            logging.warning("Failed to load image '{}': {}".format(path, e))
+            image = None
+        
+        self.images[path] = image
+        return image
+    
+    def get_powerup(self, powerup_type, color, size):
+        key = ("powerup", powerup_type, color, size)
+        surface = self._lookup(key)
+        if surface is not None:
+            return surface
+        
+        image = self.load_image("images/powerup_{}.png".format(powerup_type))
+        if image is not None:
+            surface = self._convert(pygame.transform.scale(image, (size, size)), alpha=True)
+        else:
+            surface = self._convert(pygame.Surface((size, size)))
+            surface.fill(color)
+        
+        self.surfaces[key] = surface
+        return surface
+    
+    def preload(self, game_config=None):
+        game_config = game_config or config
+        entity_size = (game_config.entity.SIZE, game_config.entity.SIZE)
+        self.get_solid(game_config.player.COLOR, entity_size)
+        for archetype in game_config.enemy.ARCHETYPES:
+            self.get_solid(archetype['color'], entity_size)
+        
+        for powerup_type, color in game_config.powerup.COLORS.items():
+            self.get_powerup(powerup_type, color, game_config.powerup.SIZE)
+    
+    def clear(self):
+        self.surfaces = {}
+        self.images = {}
+        self.hits = 0
+        self.misses = 0
+    
+    def get_stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "surfaces": len(self.surfaces),
+            "images": len(self.images),
+        }
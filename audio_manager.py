@@ -1,19 +1,25 @@
 import pygame
 import logging
+from config import GameConfig
+
+config = GameConfig()
 
 
 class AudioManager:
-    _instance = None
-    
-    def __init__(self):
+    def __init__(self, game_config=None):
+        self.config = game_config or config
         self.sounds = {}
+        self.missing = set()
+        self.pending = {}
+        self.channels = []
+        self.voices = []
+        self.requested = 0
+        self.merged = 0
+        self.dropped = 0
+        self.stolen = 0
+        self.started = 0
         self._load_sounds()
-    
-    @classmethod
-    def get(cls):
-        if not cls._instance:
-            cls._instance = AudioManager()
-        return cls._instance
+        self._reserve_channels()
     
     def _load_sounds(self):
         sound_files = {
@@ -27,21 +33,109 @@ class AudioManager:
                 self.sounds[sound_name] = pygame.mixer.Sound(file_path)
             except (pygame.error, IOError) as e:
                 logging.warning("Failed to load sound '{}' from '{}': {}".format(sound_name, file_path, e))
+                self.missing.add(sound_name)
+    
+    def _reserve_channels(self):
+        if not pygame.mixer.get_init():
+            return
+        
+        count = self.config.audio.CHANNELS
+        try:
+            if pygame.mixer.get_num_channels() < count:
+                pygame.mixer.set_num_channels(count)
+            pygame.mixer.set_reserved(count)
+            self.channels = [pygame.mixer.Channel(i) for i in range(count)]
+        except pygame.error as e:
+            logging.warning("Failed to reserve {} mixer channels: {}".format(count, e))
+            self.channels = []
+        self.voices = [None] * len(self.channels)
     
     def play(self, sound_name, volume=1.0):
         if sound_name not in self.sounds:
-            logging.warning("Sound '{}' not found".format(sound_name))
+            if sound_name not in self.missing:
+                logging.warning("Sound '{}' not found".format(sound_name))
+                self.missing.add(sound_name)
+            return False
+        
+        self.requested += 1
+        if sound_name in self.pending:
+            self.merged += 1
+            if volume <= self.pending[sound_name]:
+                return True
+        self.pending[sound_name] = volume
+        return True
+    
+    def flush(self):
+        if not self.pending:
+            return
+        
+        pending = self.pending
+        self.pending = {}
+        
+        priorities = self.config.audio.PRIORITIES
+        default_priority = self.config.audio.DEFAULT_PRIORITY
+        for sound_name in sorted(pending, key=lambda name: -priorities.get(name, default_priority)):
+            self._start_voice(sound_name, pending[sound_name], priorities.get(sound_name, default_priority))
+    
+    def _start_voice(self, sound_name, volume, priority):
+        slot = self._find_slot(sound_name, priority)
+        if slot is None:
+            self.dropped += 1
             return False
         
         try:
-            sound = self.sounds[sound_name]
-            sound.set_volume(volume)
-            sound.play()
+            channel = self.channels[slot]
+            channel.play(self.sounds[sound_name])
+            channel.set_volume(volume)
+            self.voices[slot] = (sound_name, priority, self.started)
+            self.started += 1
             return True
         except pygame.error as e:
             logging.warning("Failed to play sound '{}': {}".format(sound_name, e))
             return False
     
+    def _find_slot(self, sound_name, priority):
+        free = None
+        oldest_same = None
+        same_count = 0
+        victim = None
+        
+        for slot, channel in enumerate(self.channels):
+            voice = self.voices[slot]
+            if voice is None or not channel.get_busy():
+                self.voices[slot] = None
+                if free is None:
+                    free = slot
+                continue
+            
+            if voice[0] == sound_name:
+                same_count += 1
+                if oldest_same is None or voice[2] < self.voices[oldest_same][2]:
+                    oldest_same = slot
+            
+            if voice[1] <= priority and (victim is None or voice[1:] < self.voices[victim][1:]):
+                victim = slot
+        
+        if same_count >= self.config.audio.MAX_VOICES_PER_SOUND:
+            self.stolen += 1
+            return oldest_same
+        
+        if free is not None:
+            return free
+        
+        if victim is not None:
+            self.stolen += 1
+        return victim
+    
+    def get_stats(self):
+        return {
+            "requested": self.requested,
+            "merged": self.merged,
+            "dropped": self.dropped,
+            "stolen": self.stolen,
+            "channels": len(self.channels),
+        }
+    
     def stop(self, sound_name):
         if sound_name not in self.sounds:
             return False
@@ -54,6 +148,7 @@ class AudioManager:
             return False
     
     def stop_all(self):
+        self.pending.clear()
         pygame.mixer.stop()
     
     def set_volume(self, sound_name, volume):
@@ -71,3 +166,23 @@ class AudioManager:
         volume = max(0.0, min(1.0, volume))
         for sound in self.sounds.values():
             sound.set_volume(volume)
+
+
+class NullAudioManager:
+    def play(self, sound_name, volume=1.0):
+        return False
+    
+    def flush(self):
+        pass
+    
+    def stop(self, sound_name):
+        return False
+    
+    def stop_all(self):
+        pass
+    
+    def set_volume(self, sound_name, volume):
+        return False
+    
+    def set_master_volume(self, volume):
+        pass
@@ -0,0 +1,179 @@
+import argparse
+import ast
+import json
+import logging
+import multiprocessing
+import os
+import random
+import sys
+import time
+from input_source import NullInput, RandomInput, EvadeInput
+from simulation import HeadlessSimulation
+from config import GameConfig
+
+config = GameConfig()
+
+POLICIES = {
+    "idle": lambda rng: NullInput(),
+    "random": lambda rng: RandomInput(rng),
+    "evade": lambda rng: EvadeInput(),
+}
+
+_simulation = None
+
+
+def parse_overrides(assignments):
+    overrides = []
+    for assignment in assignments:
+        key, _, value = assignment.partition("=")
+        section, _, name = key.partition(".")
+        if not name or not value:
+            raise ValueError("Override must look like section.NAME=value: {}".format(assignment))
+        overrides.append((section, name, ast.literal_eval(value)))
+    return overrides
+
+
+def apply_overrides(overrides, game_config=None):
+    game_config = game_config or GameConfig()
+    for section, name, value in overrides:
+        section_config = getattr(game_config, section, None)
+        if section_config is None or not hasattr(section_config, name):
+            raise ValueError("Unknown config value: {}.{}".format(section, name))
+        setattr(section_config, name, value)
+    
+    game_config.width = game_config.display.WIDTH
+    game_config.height = game_config.display.HEIGHT
+    return game_config
+
+
+def _init_worker(overrides):
+    global _simulation
+    _simulation = HeadlessSimulation(game_config=apply_overrides(overrides))
+
+
+def run_game(task):
+    game_index, seed, policy, max_frames = task
+    
+    simulation = _simulation or HeadlessSimulation()
+    game_manager = simulation.game_manager
+    game_manager.input_source = POLICIES[policy](random.Random(seed ^ 0x5EED))
+    
+    simulation.reset(seed)
+    peak_enemies = 0
+    while max_frames is None or simulation.frame < max_frames:
+        alive = simulation.step()
+        enemy_count = game_manager.get_enemy_count()
+        if enemy_count > peak_enemies:
+            peak_enemies = enemy_count
+        if not alive:
+            break
+    
+    archetypes = game_manager.archetypes
+    kills = dict((archetype.name, 0) for archetype in archetypes.archetypes)
+    for color, count in game_manager.kills.items():
+        archetype = archetypes.by_color.get(color)
+        kills[archetype.name if archetype is not None else str(color)] = count
+    
+    return {
+        "game": game_index,
+        "seed": seed,
+        "policy": policy,
+        "frames": simulation.frame,
+        "survival_seconds": simulation.survival_seconds(),
+        "died": game_manager.state == "gameover",
+        "score": game_manager.score,
+        "difficulty": round(game_manager.difficulty, 4),
+        "peak_enemies": peak_enemies,
+        "kills": kills,
+    }
+
+
+class BatchSummary:
+    def __init__(self):
+        self.games = 0
+        self.deaths = 0
+        self.total_score = 0
+        self.total_seconds = 0.0
+        self.max_score = 0
+        self.max_difficulty = 0.0
+        self.max_enemies = 0
+        self.kills = {}
+    
+    def add(self, result):
+        self.games += 1
+        self.deaths += 1 if result["died"] else 0
+        self.total_score += result["score"]
+        self.total_seconds += result["survival_seconds"]
+        self.max_score = max(self.max_score, result["score"])
+        self.max_difficulty = max(self.max_difficulty, result["difficulty"])
+        self.max_enemies = max(self.max_enemies, result["peak_enemies"])
+        for name, count in result["kills"].items():
+            self.kills[name] = self.kills.get(name, 0) + count
+    
+    def as_dict(self):
+        games = max(1, self.games)
+        return {
+            "games": self.games,
+            "deaths": self.deaths,
+            "mean_score": self.total_score / float(games),
+            "mean_survival_seconds": self.total_seconds / games,
+            "max_score": self.max_score,
+            "max_difficulty": self.max_difficulty,
+            "max_peak_enemies": self.max_enemies,
+            "mean_kills": dict((name, count / float(games)) for name, count in self.kills.items()),
+        }
+
+
+def run_batch(games, output, policy="random", seed=0, workers=None, max_frames=None, overrides=(), chunksize=8):
+    workers = workers or os.cpu_count() or 1
+    tasks = ((index, seed + index, policy, max_frames) for index in range(games))
+    summary = BatchSummary()
+    
+    with open(output, "w") as f:
+        with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(list(overrides),)) as pool:
+            for result in pool.imap_unordered(run_game, tasks, chunksize):
+                f.write(json.dumps(result, sort_keys=True) + "\n")
+                f.flush()
+                summary.add(result)
+    
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run seeded headless games in parallel and collect balance stats.")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--output", default="balance_results.jsonl")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-frames", type=int, default=None)
+    parser.add_argument("--chunksize", type=int, default=8)
+    parser.add_argument("--set", dest="overrides", action="append", default=[],
+                        help="Override a config value, e.g. spawn.RATE_BASE=70")
+    args = parser.parse_args(argv)
+    
+    try:
+        overrides = parse_overrides(args.overrides)
+        apply_overrides(overrides)
+    except (ValueError, SyntaxError) as e:
+        logging.error("Invalid override: {}".format(e))
+        return 1
+    
+    start = time.perf_counter()
+    summary = run_batch(
+        args.games, args.output, args.policy, args.seed,
+        args.workers, args.max_frames, overrides, args.chunksize
+    )
+    elapsed = time.perf_counter() - start
+    
+    logging.info("Finished {} games in {:.2f}s, results in '{}'".format(summary.games, elapsed, args.output))
+    logging.info(json.dumps(summary.as_dict(), indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+    sys.exit(main())
@@ -0,0 +1,232 @@
+import argparse
+import json
+import logging
+import platform
+import random
+import sys
+import time
+import pygame
+from balance_runner import parse_overrides, apply_overrides
+from game_manager import GameManager
+from text_cache import TextCache
+from config import GameConfig
+
+config = GameConfig()
+
+DEFAULT_COUNTS = [10, 100, 1000, 10000]
+
+
+def build_world(enemy_count, seed, game_config=None):
+    game_manager = GameManager(headless=True, seed=seed, game_config=game_config or config)
+    game_manager.reset_game(seed)
+    game_manager.state = "game"
+    
+    player = game_manager.get_player()
+    player.max_health = player.health = 10 ** 9
+    
+    for _ in range(enemy_count):
+        game_manager.spawn_enemy()
+    
+    _scatter_enemies(game_manager, random.Random(seed))
+    return game_manager
+
+
+def _scatter_enemies(game_manager, rng):
+    game_config = game_manager.config
+    max_x = game_config.width - game_config.entity.SIZE
+    max_y = game_config.height - game_config.entity.SIZE
+    
+    enemy_store = game_manager.enemy_store
+    if enemy_store is not None:
+        for i in range(len(enemy_store)):
+            enemy_store.x[i] = rng.randint(0, max_x)
+            enemy_store.y[i] = rng.randint(0, max_y)
+        return
+    
+    for enemy in game_manager.registry.enemies:
+        enemy.rect.topleft = (rng.randint(0, max_x), rng.randint(0, max_y))
+
+
+def _attach_fonts(game_manager):
+    game_manager.font = pygame.font.Font(None, game_manager.config.ui.FONT_SIZE_NORMAL)
+    game_manager.big_font = pygame.font.Font(None, game_manager.config.ui.FONT_SIZE_LARGE)
+    game_manager.text_cache = TextCache()
+
+
+def bench_entity_update(enemy_count, seed, game_config):
+    game_manager = build_world(enemy_count, seed, game_config)
+    
+    def run():
+        game_manager.tracking.begin_tick(game_manager.get_player())
+        for entity in game_manager.entities:
+            entity.update(game_manager)
+        if game_manager.enemy_store is not None:
+            game_manager.enemy_store.update(game_manager)
+    return run
+
+
+def bench_enemy_collisions(enemy_count, seed, game_config):
+    game_manager = build_world(enemy_count, seed, game_config)
+    
+    def run():
+        game_manager.collision_handler.check_enemy_enemy_collisions()
+        game_manager.registry.flush()
+    return run
+
+
+def bench_player_collisions(enemy_count, seed, game_config):
+    game_manager = build_world(enemy_count, seed, game_config)
+    return game_manager.collision_handler.check_player_enemy_collisions
+
+
+def bench_powerups(enemy_count, seed, game_config):
+    game_manager = build_world(enemy_count, seed, game_config)
+    player = game_manager.get_player()
+    
+    def run():
+        for _ in range(10):
+            game_manager.spawn_powerup()
+        for powerup in game_manager.powerups:
+            powerup.rect.center = player.rect.center
+        game_manager.check_powerup_collisions()
+        game_manager.registry.flush()
+    return run
+
+
+def bench_draw(enemy_count, seed, game_config):
+    game_manager = build_world(enemy_count, seed, game_config)
+    _attach_fonts(game_manager)
+    for _ in range(10):
+        game_manager.spawn_powerup()
+    surface = pygame.Surface((game_config.width, game_config.height))
+    
+    def run():
+        surface.fill(game_config.display.BACKGROUND_COLOR)
+        game_manager.draw(surface)
+    return run
+
+
+SCENARIOS = {
+    "entity_update": (bench_entity_update, False),
+    "enemy_collisions": (bench_enemy_collisions, True),
+    "player_collisions": (bench_player_collisions, True),
+    "powerups": (bench_powerups, True),
+    "draw": (bench_draw, False),
+}
+
+
+def run_scenario(name, enemy_count, repeat, seed, game_config=None):
+    game_config = game_config or config
+    setup, mutates_world = SCENARIOS[name]
+    timings = []
+    run = None
+    
+    for _ in range(repeat):
+        if run is None or mutates_world:
+            run = setup(enemy_count, seed, game_config)
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    
+    timings.sort()
+    return {
+        "enemies": enemy_count,
+        "repeat": repeat,
+        "min_ms": timings[0] * 1000.0,
+        "median_ms": timings[len(timings) // 2] * 1000.0,
+    }
+
+
+def run_suite(scenarios, counts, repeat, seed, game_config=None):
+    results = {}
+    for name in scenarios:
+        for enemy_count in counts:
+            key = "{}/{}".format(name, enemy_count)
+            results[key] = run_scenario(name, enemy_count, repeat, seed, game_config)
+            logging.info("{:<28} median {:10.3f} ms  min {:10.3f} ms".format(
+                key, results[key]["median_ms"], results[key]["min_ms"]))
+    return results
+
+
+def compare_to_baseline(results, baseline, threshold):
+    regressions = []
+    for key, result in sorted(results.items()):
+        reference = baseline.get(key)
+        if reference is None or reference["median_ms"] <= 0:
+            continue
+        
+        ratio = result["median_ms"] / reference["median_ms"]
+        if ratio > 1.0 + threshold:
+            regressions.append((key, reference["median_ms"], result["median_ms"], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark simulation and rendering hot paths headless.")
+    parser.add_argument("--scenario", dest="scenarios", action="append", choices=sorted(SCENARIOS))
+    parser.add_argument("--counts", type=int, nargs="+", default=DEFAULT_COUNTS)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", default=None)
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Allowed slowdown against the baseline, e.g. 0.10 for 10%%")
+    parser.add_argument("--set", dest="overrides", action="append", default=[],
+                        help="Override a config value, e.g. collision.BROADPHASE='pairwise'")
+    args = parser.parse_args(argv)
+    
+    try:
+        game_config = apply_overrides(parse_overrides(args.overrides))
+    except (ValueError, SyntaxError) as e:
+        logging.error("Invalid override: {}".format(e))
+        return 1
+    
+    pygame.font.init()
+    scenarios = args.scenarios or sorted(SCENARIOS)
+    results = run_suite(scenarios, args.counts, args.repeat, args.seed, game_config)
+    
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "overrides": args.overrides,
+        },
+        "results": results,
+    }
+    
+    try:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    except IOError as e:
+        logging.error("Failed to write results to '{}': {}".format(args.output, e))
+        return 1
+    
+    if args.baseline is None:
+        return 0
+    
+    try:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)["results"]
+    except (IOError, ValueError, KeyError) as e:
+        logging.error("Failed to load baseline '{}': {}".format(args.baseline, e))
+        return 1
+    
+    regressions = compare_to_baseline(results, baseline, args.threshold)
+    for key, before, after, ratio in regressions:
+        logging.error("Regression in {}: {:.3f} ms -> {:.3f} ms ({:+.0%})".format(key, before, after, ratio - 1.0))
+    
+    if regressions:
+        return 1
+    
+    logging.info("No regressions beyond {:.0%} against '{}'".format(args.threshold, args.baseline))
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+    sys.exit(main())
@@ -0,0 +1,56 @@
+from config import GameConfig
+
+config = GameConfig()
+
+EVENT_PLAYER_HIT = 0
+EVENT_ENEMY_PAIR = 1
+
+
+class CollisionEventBuffer:
+    def __init__(self, capacity=None):
+        self.capacity = capacity or config.collision.EVENT_BUFFER_SIZE
+        self.kinds = [0] * self.capacity
+        self.firsts = [0] * self.capacity
+        self.seconds = [0] * self.capacity
+        self.count = 0
+        self.peak = 0
+    
+    def __len__(self):
+        return self.count
+    
+    def clear(self):
+        self.count = 0
+    
+    def _grow(self, needed):
+        while self.capacity < needed:
+            self.capacity *= 2
+        
+        extra = self.capacity - len(self.kinds)
+        self.kinds.extend([0] * extra)
+        self.firsts.extend([0] * extra)
+        self.seconds.extend([0] * extra)
+    
+    def push(self, kind, first, second=-1):
+        i = self.count
+        if i >= self.capacity:
+            self._grow(i + 1)
+        
+        self.kinds[i] = kind
+        self.firsts[i] = first
+        self.seconds[i] = second
+        self.count = i + 1
+        if self.count > self.peak:
+            self.peak = self.count
+    
+    def push_pairs(self, pairs):
+        start = self.count
+        end = start + len(pairs)
+        if end > self.capacity:
+            self._grow(end)
+        
+        self.kinds[start:end] = [EVENT_ENEMY_PAIR] * len(pairs)
+        self.firsts[start:end] = [first for first, _ in pairs]
+        self.seconds[start:end] = [second for _, second in pairs]
+        self.count = end
+        if end > self.peak:
+            self.peak = end
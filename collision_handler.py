@@ -1,119 +1,104 @@
-from entities import Player, Enemy
-from audio_manager import AudioManager
-from config import GameConfig
-
-config = GameConfig()
+from collision_events import CollisionEventBuffer, EVENT_PLAYER_HIT
+from collision_resolver import CollisionResolver
+from parallel_broadphase import create_parallel_broadphase
+from spatial_hash import SpatialHash
 
 
 class CollisionHandler:
     def __init__(self, game_manager):
         self.game_manager = game_manager
-        self.audio_manager = AudioManager.get()
+        self.config = game_manager.config
+        self.broadphase = self.config.collision.BROADPHASE
+        self.spatial_hash = SpatialHash(
+            self.config.width,
+            self.config.height,
+            self.config.collision.BROADPHASE_CELL_SIZE
+        )
+        self.parallel = None
+        if self.broadphase == "parallel":
+            self.parallel = create_parallel_broadphase(self.config)
+            if self.parallel is None:
+                self.broadphase = "grid"
+        self.events = CollisionEventBuffer(self.config.collision.EVENT_BUFFER_SIZE)
+        self.resolver = CollisionResolver(game_manager)
     
     def check_all_collisions(self):
-        self.check_player_enemy_collisions()
-        self.check_enemy_enemy_collisions()
+        self.events.clear()
+        self.detect_player_hits(self.events)
+        self.detect_enemy_pairs(self.events)
+        return self.resolve(self.events)
     
     def check_player_enemy_collisions(self):
-        player = self.game_manager.get_player()
-        if not player:
-            return
-        
-        for enemy in list(self.game_manager.entities):
-            if not isinstance(enemy, Enemy):
-                continue
-            
-            if player.rect.colliderect(enemy.rect):
-                died = player.take_damage(config.collision.DAMAGE_AMOUNT)
-                
-                if died:
-                    self.audio_manager.play('die_player')
-                    self.game_manager.game_over()
-                else:
-                    self.audio_manager.play('hurt_player')
-                    self._apply_player_knockback(player, enemy)
+        self.events.clear()
+        self.detect_player_hits(self.events)
+        return self.resolve(self.events)
     
     def check_enemy_enemy_collisions(self):
-        enemies = [e for e in self.game_manager.entities if isinstance(e, Enemy)]
-        
-        for i, enemy1 in enumerate(enemies):
-            for enemy2 in enemies[i + 1:]:
-                if enemy1.rect.colliderect(enemy2.rect):
-                    self._handle_enemy_collision(enemy1, enemy2)
+        self.events.clear()
+        self.detect_enemy_pairs(self.events)
+        return self.resolve(self.events)
     
-    def _apply_player_knockback(self, player, enemy):
-        dx = player.rect.centerx - enemy.rect.centerx
-        dy = player.rect.centery - enemy.rect.centery
+    def resolve(self, events):
+        enemy_store = self.game_manager.enemy_store
+        if enemy_store is None:
+            return self.resolver.resolve_entities(events, self.game_manager.registry.enemies)
         
-        distance = (dx * dx + dy * dy) ** 0.5
-        if distance > 0:
-            dx = dx / distance
-            dy = dy / distance
-            
-            player.rect.x += int(dx * config.collision.KNOCKBACK_DISTANCE)
-            player.rect.y += int(dy * config.collision.KNOCKBACK_DISTANCE)
+        fatal = self.resolver.resolve_store(events, enemy_store)
+        enemy_store.compact()
+        return fatal
     
-    def _handle_enemy_collision(self, enemy1, enemy2):
-        red_powerup_active = self.game_manager.red_powerup_timer > 0
+    def detect_player_hits(self, events):
+        player = self.game_manager.get_player()
+        if not player:
+            return
         
-        if red_powerup_active:
-            if enemy1.color == config.enemy.COLOR_RED and enemy2.color != config.enemy.COLOR_RED:
-                self._destroy_enemy(enemy2)
-                return
-            elif enemy2.color == config.enemy.COLOR_RED and enemy1.color != config.enemy.COLOR_RED:
-                self._destroy_enemy(enemy1)
-                return
+        enemy_store = self.game_manager.enemy_store
+        if enemy_store is not None:
+            i = enemy_store.first_overlap(player.rect)
+            while i >= 0:
+                events.push(EVENT_PLAYER_HIT, i)
+                i = enemy_store.first_overlap(player.rect, i + 1)
+            return
         
-        if enemy1.color != enemy2.color:
-            self._handle_different_color_collision(enemy1, enemy2)
-        else:
-            self._handle_same_color_collision(enemy1, enemy2)
+        for i, enemy in enumerate(self.game_manager.registry.enemies):
+            if player.rect.colliderect(enemy.rect):
+                events.push(EVENT_PLAYER_HIT, i)
     
-    def _handle_different_color_collision(self, enemy1, enemy2):
-        color_strength = {
-            config.enemy.COLOR_PURPLE: 4,
-            config.enemy.COLOR_GREEN: 3,
-            config.enemy.COLOR_ORANGE: 2,
-            config.enemy.COLOR_RED: 1,
-        }
-        
-        strength1 = color_strength.get(enemy1.color, 0)
-        strength2 = color_strength.get(enemy2.color, 0)
+    def detect_enemy_pairs(self, events):
+        enemy_store = self.game_manager.enemy_store
+        if enemy_store is not None:
+            if self._use_parallel(enemy_store.count):
+                n = enemy_store.count
+                events.push_pairs(self.parallel.colliding_pairs_arrays(
+                    enemy_store.x[:n], enemy_store.y[:n], enemy_store.size))
+            else:
+                events.push_pairs(enemy_store.colliding_pairs())
+            return
         
-        if strength1 > strength2:
-            self._destroy_enemy(enemy2)
-        elif strength2 > strength1:
-            self._destroy_enemy(enemy1)
+        events.push_pairs(self.find_enemy_pairs(self.game_manager.registry.enemies))
     
-    def _handle_same_color_collision(self, enemy1, enemy2):
-        enemy1.vx = -enemy1.vx
-        enemy1.vy = -enemy1.vy
-        enemy2.vx = -enemy2.vx
-        enemy2.vy = -enemy2.vy
+    def find_enemy_pairs(self, enemies):
+        if self.broadphase == "pairwise":
+            return self._find_pairs_pairwise(enemies)
         
-        if enemy1.enemy_type == "track":
-            enemy1.confuse(config.enemy.CONFUSION_DURATION)
-        if enemy2.enemy_type == "track":
-            enemy2.confuse(config.enemy.CONFUSION_DURATION)
+        rects = [enemy.rect for enemy in enemies]
+        if self._use_parallel(len(rects)):
+            return self.parallel.colliding_pairs(rects)
+        return self.spatial_hash.colliding_pairs(rects)
     
-    def _destroy_enemy(self, enemy):
-        if enemy in self.game_manager.entities:
-            self.game_manager.entities.remove(enemy)
-            self.audio_manager.play('die_enemy')
-            self._heal_player_for_enemy(enemy)
+    def _use_parallel(self, count):
+        return self.parallel is not None and count >= self.config.collision.PARALLEL_MIN_ENTITIES
     
-    def _heal_player_for_enemy(self, enemy):
-        player = self.game_manager.get_player()
-        if not player:
-            return
+    def _find_pairs_pairwise(self, enemies):
+        pairs = []
         
-        heal_amounts = {
-            config.enemy.COLOR_RED: config.collision.HEAL_RED,
-            config.enemy.COLOR_ORANGE: config.collision.HEAL_ORANGE,
-            config.enemy.COLOR_PURPLE: config.collision.HEAL_PURPLE,
-            config.enemy.COLOR_GREEN: config.collision.HEAL_GREEN,
-        }
+        for i, enemy1 in enumerate(enemies):
+            for j in range(i + 1, len(enemies)):
+                if enemy1.rect.colliderect(enemies[j].rect):
+                    pairs.append((i, j))
         
-        heal_amount = heal_amounts.get(enemy.color, 0)
-        if heal_amount > 0:
-            player.heal(heal_amount)
+        return pairs
+    
+    def close(self):
+        if self.parallel is not None:
+            self.parallel.close()
@@ -0,0 +1,175 @@
+from collision_events import EVENT_PLAYER_HIT
+
+OUTCOME_NONE = 0
+OUTCOME_KILL_FIRST = 1
+OUTCOME_KILL_SECOND = 2
+OUTCOME_BOUNCE = 3
+
+
+class CollisionResolver:
+    def __init__(self, game_manager):
+        self.game_manager = game_manager
+        self.archetypes = game_manager.archetypes
+        self.config = game_manager.config
+        self.kill_counts = [0] * len(self.archetypes)
+        self.outcomes = (
+            self._build_outcomes(red_powerup_active=False),
+            self._build_outcomes(red_powerup_active=True),
+        )
+    
+    def _build_outcomes(self, red_powerup_active):
+        red_type = self.archetypes.type_id_of('red')
+        count = len(self.archetypes)
+        table = []
+        
+        for type1 in range(count):
+            row = []
+            for type2 in range(count):
+                if red_powerup_active and type1 == red_type and type2 != red_type:
+                    row.append(OUTCOME_KILL_SECOND)
+                elif red_powerup_active and type2 == red_type and type1 != red_type:
+                    row.append(OUTCOME_KILL_FIRST)
+                elif type1 == type2:
+                    row.append(OUTCOME_BOUNCE)
+                else:
+                    stronger = self.archetypes.strength_table[type1][type2]
+                    if stronger > 0:
+                        row.append(OUTCOME_KILL_SECOND)
+                    elif stronger < 0:
+                        row.append(OUTCOME_KILL_FIRST)
+                    else:
+                        row.append(OUTCOME_NONE)
+            table.append(row)
+        
+        return table
+    
+    def resolve_entities(self, events, enemies):
+        game_manager = self.game_manager
+        player = game_manager.get_player()
+        outcomes = self.outcomes[game_manager.red_powerup_timer > 0]
+        tracking_table = self.archetypes.tracking_table
+        kill_counts = self.kill_counts
+        kinds = events.kinds
+        firsts = events.firsts
+        seconds = events.seconds
+        
+        for n in range(events.count):
+            if kinds[n] == EVENT_PLAYER_HIT:
+                if self._resolve_player_hit(player, enemies[firsts[n]].rect):
+                    return True
+                continue
+            
+            enemy1 = enemies[firsts[n]]
+            enemy2 = enemies[seconds[n]]
+            if not enemy1.alive or not enemy2.alive:
+                continue
+            
+            outcome = outcomes[enemy1.type_id][enemy2.type_id]
+            if outcome == OUTCOME_KILL_SECOND:
+                if game_manager.remove_entity(enemy2):
+                    kill_counts[enemy2.type_id] += 1
+            elif outcome == OUTCOME_KILL_FIRST:
+                if game_manager.remove_entity(enemy1):
+                    kill_counts[enemy1.type_id] += 1
+            elif outcome == OUTCOME_BOUNCE:
+                enemy1.vx = -enemy1.vx
+                enemy1.vy = -enemy1.vy
+                enemy2.vx = -enemy2.vx
+                enemy2.vy = -enemy2.vy
+                if tracking_table[enemy1.type_id]:
+                    enemy1.confuse(self.config.enemy.CONFUSION_DURATION)
+                    enemy2.confuse(self.config.enemy.CONFUSION_DURATION)
+        
+        self._apply_kills(player)
+        return False
+    
+    def resolve_store(self, events, enemy_store):
+        game_manager = self.game_manager
+        player = game_manager.get_player()
+        outcomes = self.outcomes[game_manager.red_powerup_timer > 0]
+        kill_counts = self.kill_counts
+        kinds = events.kinds
+        firsts = events.firsts
+        seconds = events.seconds
+        
+        alive = enemy_store.alive
+        type_ids = enemy_store.type_id
+        
+        for n in range(events.count):
+            i = firsts[n]
+            if kinds[n] == EVENT_PLAYER_HIT:
+                if self._resolve_player_hit(player, enemy_store.rect_of(i)):
+                    return True
+                continue
+            
+            j = seconds[n]
+            if not alive[i] or not alive[j]:
+                continue
+            
+            type1 = int(type_ids[i])
+            type2 = int(type_ids[j])
+            outcome = outcomes[type1][type2]
+            if outcome == OUTCOME_KILL_SECOND:
+                if enemy_store.kill(j):
+                    kill_counts[type2] += 1
+            elif outcome == OUTCOME_KILL_FIRST:
+                if enemy_store.kill(i):
+                    kill_counts[type1] += 1
+            elif outcome == OUTCOME_BOUNCE:
+                for k in (i, j):
+                    enemy_store.vx[k] = -enemy_store.vx[k]
+                    enemy_store.vy[k] = -enemy_store.vy[k]
+                    if enemy_store.is_tracking(k):
+                        enemy_store.confused[k] = self.config.enemy.CONFUSION_DURATION
+        
+        self._apply_kills(player)
+        return False
+    
+    def _resolve_player_hit(self, player, enemy_rect):
+        if not player.rect.colliderect(enemy_rect):
+            return False
+        
+        audio_manager = self.game_manager.audio_manager
+        died = player.take_damage(self.config.collision.DAMAGE_AMOUNT)
+        
+        if died:
+            audio_manager.play('die_player')
+            self.game_manager.game_over()
+            return True
+        
+        audio_manager.play('hurt_player')
+        self._apply_player_knockback(player, enemy_rect)
+        return False
+    
+    def _apply_player_knockback(self, player, enemy_rect):
+        dx = player.rect.centerx - enemy_rect.centerx
+        dy = player.rect.centery - enemy_rect.centery
+        
+        distance = (dx * dx + dy * dy) ** 0.5
+        if distance > 0:
+            dx = dx / distance
+            dy = dy / distance
+            
+            player.rect.x += int(dx * self.config.collision.KNOCKBACK_DISTANCE)
+            player.rect.y += int(dy * self.config.collision.KNOCKBACK_DISTANCE)
+    
+    def _apply_kills(self, player):
+        kill_counts = self.kill_counts
+        heal_table = self.archetypes.heal_table
+        colors = self.archetypes.colors
+        killed = 0
+        heal_amount = 0
+        
+        for type_id, count in enumerate(kill_counts):
+            if count:
+                self.game_manager.record_kill(colors[type_id], count)
+                heal_amount += heal_table[type_id] * count
+                killed += count
+                kill_counts[type_id] = 0
+        
+        if not killed:
+            return
+        
+        self.game_manager.audio_manager.play('die_enemy')
+        if player is not None and heal_amount > 0:
+            player.heal(heal_amount)
@@ -1,7 +1,12 @@
+import copy
+
+
 class DisplayConfig:
     WIDTH = 800
     HEIGHT = 600
     BACKGROUND_COLOR = (0, 0, 0)
+    USE_DIRTY_RECTS = True
+    DIRTY_RECT_MAX_RATIO = 0.4
 
 
 class EntityConfig:
@@ -26,12 +31,17 @@ class EnemyConfig:
     COLOR_PURPLE = (128, 0, 128)
     SPEED_SLOW = 2
     SPEED_FAST = 4
-    SPAWN_PROB_RED = 0.3
-    SPAWN_PROB_ORANGE = 0.3
-    SPAWN_PROB_GREEN = 0.2
-    SPAWN_PROB_PURPLE = 0.2
+    ARCHETYPES = (
+        {'name': 'red', 'color': COLOR_RED, 'speed': SPEED_SLOW, 'movement': 'bounce', 'spawn_prob': 0.3},
+        {'name': 'orange', 'color': COLOR_ORANGE, 'speed': SPEED_FAST, 'movement': 'bounce', 'spawn_prob': 0.3},
+        {'name': 'green', 'color': COLOR_GREEN, 'speed': SPEED_SLOW, 'movement': 'track', 'spawn_prob': 0.2},
+        {'name': 'purple', 'color': COLOR_PURPLE, 'speed': SPEED_FAST, 'movement': 'bounce', 'spawn_prob': 0.2},
+    )
     CONFUSION_DURATION = 60
     TRACKING_UPDATE_RATE = 10
+    TRACKING_CELL_SIZE = 20
+    USE_ARRAY_STORE = False
+    STORE_CAPACITY = 1024
 
 
 class SpawnConfig:
@@ -45,6 +55,13 @@ class SpawnConfig:
 
 class PowerUpConfig:
     DURATION = 300
+    SIZE = 20
+    COLORS = {
+        'blue': (0, 150, 255),
+        'green': (0, 255, 0),
+        'red': (255, 0, 0),
+        'yellow': (255, 255, 0),
+    }
     SPAWN_MARGIN = 50
     SPAWN_PROB_BLUE = 0.3
     SPAWN_PROB_GREEN = 0.3
@@ -55,10 +72,26 @@ class PowerUpConfig:
 class CollisionConfig:
     DAMAGE_AMOUNT = 5
     KNOCKBACK_DISTANCE = 10
-    HEAL_RED = 1
-    HEAL_ORANGE = 1
-    HEAL_PURPLE = 1
-    HEAL_GREEN = 2
+    STRENGTH = {
+        'red': 1,
+        'orange': 2,
+        'green': 3,
+        'purple': 4,
+    }
+    HEAL = {
+        'red': 1,
+        'orange': 1,
+        'green': 2,
+        'purple': 1,
+    }
+    BROADPHASE = "grid"
+    BROADPHASE_CELL_SIZE = EntityConfig.SIZE * 2
+    EVENT_BUFFER_SIZE = 256
+    PARALLEL_WORKERS = 4
+    PARALLEL_START_METHOD = "spawn"
+    PARALLEL_MIN_ENTITIES = 2000
+    PARALLEL_CAPACITY = 4096
+    PARALLEL_RESULT_CAPACITY = 4096
 
 
 class UIConfig:
@@ -80,18 +113,101 @@ class UIConfig:
     SCORE_MARGIN = 10
     POWERUP_TIMER_Y_START = 100
     POWERUP_TIMER_Y_OFFSET = 30
+    TEXT_CACHE_SIZE = 64
+
+
+class ReplayConfig:
+    CRASH_REPLAY_FILE = "crash_replay.rpl"
+
+
+class ProfilerConfig:
+    ENABLED = False
+    HISTORY_FRAMES = 600
+    OVERLAY_REFRESH_FRAMES = 30
+    OVERLAY_FONT_SIZE = 20
+    TRACE_FILE = "frame_trace.json"
+
+
+class SaveStateConfig:
+    HISTORY_FRAMES = 600
+    HISTORY_WITHOUT_STORE = False
+    REWIND_FRAMES = 60
+    CRASH_STATE_FILE = "crash_state.sav"
+
+
+class VectorEnvConfig:
+    NEAREST_ENEMIES = 4
+    MAX_EPISODE_FRAMES = 0
+    REWARD_ALIVE = 0.01
+    REWARD_HEALTH = 0.1
+    REWARD_DEATH = -1.0
+
+
+class PoolConfig:
+    ENEMY_CAP = 2048
+    POWERUP_CAP = 32
+
+
+class TimestepConfig:
+    MAX_CATCH_UP_STEPS = 5
+    RENDER_FPS = 60
+
+
+class PipelineConfig:
+    ENABLED = False
+
+
+class LeaderboardConfig:
+    FILE = "leaderboard.json"
+    LEGACY_FILE = "highscore.txt"
+    MAX_ENTRIES = 10
+    DEFAULT_PROFILE = "player"
+    WRITE_BATCH_SECONDS = 0.5
+
+
+class AudioConfig:
+    CHANNELS = 8
+    MAX_VOICES_PER_SOUND = 3
+    DEFAULT_PRIORITY = 1
+    PRIORITIES = {
+        'die_player': 3,
+        'hurt_player': 2,
+        'die_enemy': 1,
+    }
+
+
+class StartupConfig:
+    FIRST_FRAME_BUDGET_MS = 250
+
+
+def _section(section_class):
+    section = section_class()
+    for name, value in vars(section_class).items():
+        if name.isupper() and isinstance(value, (dict, list, tuple)):
+            setattr(section, name, copy.deepcopy(value))
+    return section
 
 
 class GameConfig:
     def __init__(self):
-        self.display = DisplayConfig()
-        self.entity = EntityConfig()
-        self.player = PlayerConfig()
-        self.enemy = EnemyConfig()
-        self.spawn = SpawnConfig()
-        self.powerup = PowerUpConfig()
-        self.collision = CollisionConfig()
-        self.ui = UIConfig()
+        self.display = _section(DisplayConfig)
+        self.entity = _section(EntityConfig)
+        self.player = _section(PlayerConfig)
+        self.enemy = _section(EnemyConfig)
+        self.spawn = _section(SpawnConfig)
+        self.powerup = _section(PowerUpConfig)
+        self.collision = _section(CollisionConfig)
+        self.ui = _section(UIConfig)
+        self.replay = _section(ReplayConfig)
+        self.profiler = _section(ProfilerConfig)
+        self.pool = _section(PoolConfig)
+        self.timestep = _section(TimestepConfig)
+        self.pipeline = _section(PipelineConfig)
+        self.leaderboard = _section(LeaderboardConfig)
+        self.audio = _section(AudioConfig)
+        self.startup = _section(StartupConfig)
+        self.savestate = _section(SaveStateConfig)
+        self.vector_env = _section(VectorEnvConfig)
         self.width = self.display.WIDTH
         self.height = self.display.HEIGHT
         self.fps = 60
@@ -0,0 +1,325 @@
+import logging
+import random
+import pygame
+from asset_cache import AssetCache
+from config import GameConfig
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+config = GameConfig()
+
+STATE_FIELDS = ("x", "y", "prev_x", "prev_y", "vx", "vy", "speed", "type_id", "confused", "phase", "needs_target")
+
+
+def create_enemy_store(archetypes, game_config=None):
+    game_config = game_config or config
+    if not game_config.enemy.USE_ARRAY_STORE:
+        return None
+    
+    if np is None:
+        logging.warning("NumPy is not installed, falling back to per-object enemies")
+        return None
+    
+    return EnemyStore(archetypes, game_config=game_config)
+
+
+class EnemyStore:
+    def __init__(self, archetypes, capacity=None, game_config=None):
+        game_config = game_config or config
+        self.archetypes = archetypes
+        self.capacity = capacity or game_config.enemy.STORE_CAPACITY
+        self.size = game_config.entity.SIZE
+        self.width = game_config.width
+        self.height = game_config.height
+        self.count = 0
+        self.dirty = False
+        
+        self.tracking_types = np.array(archetypes.tracking_table, dtype=bool)
+        asset_cache = AssetCache.get()
+        self.images = [asset_cache.get_solid(color, (self.size, self.size)) for color in archetypes.colors]
+        
+        self._allocate(self.capacity)
+    
+    def _allocate(self, capacity):
+        self.x = np.zeros(capacity, dtype=np.int32)
+        self.y = np.zeros(capacity, dtype=np.int32)
+        self.prev_x = np.zeros(capacity, dtype=np.int32)
+        self.prev_y = np.zeros(capacity, dtype=np.int32)
+        self.vx = np.zeros(capacity, dtype=np.int32)
+        self.vy = np.zeros(capacity, dtype=np.int32)
+        self.speed = np.zeros(capacity, dtype=np.int32)
+        self.type_id = np.zeros(capacity, dtype=np.uint8)
+        self.confused = np.zeros(capacity, dtype=np.int32)
+        self.phase = np.zeros(capacity, dtype=np.int32)
+        self.needs_target = np.zeros(capacity, dtype=bool)
+        self.alive = np.zeros(capacity, dtype=bool)
+    
+    def _grow(self):
+        arrays = self._arrays()
+        self.capacity *= 2
+        self._allocate(self.capacity)
+        for name, old in arrays:
+            getattr(self, name)[:len(old)] = old
+    
+    def _arrays(self):
+        return [
+            (name, getattr(self, name))
+            for name in ("x", "y", "prev_x", "prev_y", "vx", "vy", "speed", "type_id", "confused", "phase", "needs_target", "alive")
+        ]
+    
+    def __len__(self):
+        return self.count
+    
+    def clear(self):
+        self.count = 0
+        self.dirty = False
+    
+    def add(self, x, y, archetype, rng=random, phase=0):
+        if self.count >= self.capacity:
+            self._grow()
+        
+        i = self.count
+        speed = archetype.speed
+        
+        self.x[i] = x
+        self.y[i] = y
+        self.prev_x[i] = x
+        self.prev_y[i] = y
+        self.speed[i] = speed
+        self.type_id[i] = archetype.type_id
+        self.confused[i] = 0
+        self.phase[i] = phase
+        self.needs_target[i] = True
+        self.alive[i] = True
+        
+        if archetype.movement == "bounce":
+            self.vx[i] = rng.choice([-1, 1]) * speed
+            self.vy[i] = rng.choice([-1, 1]) * speed
+        else:
+            self.vx[i] = 0
+            self.vy[i] = 0
+        
+        self.count += 1
+        return i
+    
+    def color_of(self, i):
+        return self.archetypes.colors[self.type_id[i]]
+    
+    def is_tracking(self, i):
+        return self.tracking_types[self.type_id[i]]
+    
+    def rect_of(self, i):
+        return pygame.Rect(int(self.x[i]), int(self.y[i]), self.size, self.size)
+    
+    def centers(self):
+        n = self.count
+        half = self.size // 2
+        return list(zip((self.x[:n] + half).tolist(), (self.y[:n] + half).tolist()))
+    
+    def save_previous_positions(self):
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+    
+    def update(self, game_manager):
+        n = self.count
+        if n == 0:
+            return
+        
+        x = self.x[:n]
+        y = self.y[:n]
+        vx = self.vx[:n]
+        vy = self.vy[:n]
+        
+        self._update_tracking(game_manager, n)
+        
+        if game_manager.yellow_powerup_timer > 0:
+            x += np.trunc(vx * 0.5).astype(np.int32)
+            y += np.trunc(vy * 0.5).astype(np.int32)
+        else:
+            x += vx
+            y += vy
+        
+        self._handle_wall_collisions(x, y, vx, vy)
+    
+    def _update_tracking(self, game_manager, n):
+        tracking = self.tracking_types[self.type_id[:n]]
+        if not tracking.any():
+            return
+        
+        confused = self.confused[:n]
+        is_confused = tracking & (confused > 0)
+        confused[is_confused] -= 1
+        
+        needs_target = self.needs_target[:n]
+        needs_target |= is_confused & (confused == 0)
+        
+        field = game_manager.tracking
+        due = ((field.tick + self.phase[:n]) % field.update_rate) == 0
+        steering = tracking & ~is_confused & (needs_target | due)
+        if not steering.any():
+            return
+        
+        directions = field.direction_field()
+        if directions is None:
+            return
+        
+        half = self.size // 2
+        indices = np.flatnonzero(steering)
+        cells = field.cells_of(self.x[indices] + half, self.y[indices] + half)
+        speed = self.speed[indices]
+        
+        self.vx[indices] = directions[0][cells] * speed
+        self.vy[indices] = directions[1][cells] * speed
+        needs_target[indices] = False
+    
+    def _handle_wall_collisions(self, x, y, vx, vy):
+        max_x = self.width - self.size
+        max_y = self.height - self.size
+        
+        hit = x <= 0
+        x[hit] = 0
+        vx[hit] = np.abs(vx[hit])
+        
+        hit = x >= max_x
+        x[hit] = max_x
+        vx[hit] = -np.abs(vx[hit])
+        
+        hit = y <= 0
+        y[hit] = 0
+        vy[hit] = np.abs(vy[hit])
+        
+        hit = y >= max_y
+        y[hit] = max_y
+        vy[hit] = -np.abs(vy[hit])
+    
+    def first_overlap(self, rect, start=0):
+        n = self.count
+        if start >= n:
+            return -1
+        
+        x = self.x[start:n]
+        y = self.y[start:n]
+        hits = (
+            (x < rect.right) & (x + self.size > rect.left) &
+            (y < rect.bottom) & (y + self.size > rect.top)
+        )
+        
+        first = int(np.argmax(hits))
+        if not hits[first]:
+            return -1
+        return start + first
+    
+    def colliding_pairs(self):
+        n = self.count
+        if n < 2:
+            return []
+        
+        order = np.argsort(self.x[:n], kind="stable")
+        xs = self.x[:n][order]
+        ys = self.y[:n][order]
+        
+        firsts = []
+        seconds = []
+        
+        for offset in range(1, n):
+            dx = xs[offset:] - xs[:-offset]
+            near = dx < self.size
+            if not near.any():
+                break
+            
+            near &= np.abs(ys[offset:] - ys[:-offset]) < self.size
+            if near.any():
+                a = order[:-offset][near]
+                b = order[offset:][near]
+                firsts.append(np.minimum(a, b))
+                seconds.append(np.maximum(a, b))
+        
+        if not firsts:
+            return []
+        
+        firsts = np.concatenate(firsts)
+        seconds = np.concatenate(seconds)
+        ordering = np.lexsort((seconds, firsts))
+        return list(zip(firsts[ordering].tolist(), seconds[ordering].tolist()))
+    
+    def kill(self, i):
+        if not self.alive[i]:
+            return False
+        
+        self.alive[i] = False
+        self.dirty = True
+        return True
+    
+    def kill_type(self, type_id):
+        n = self.count
+        matches = self.alive[:n] & (self.type_id[:n] == type_id)
+        killed = int(np.count_nonzero(matches))
+        if killed:
+            self.alive[:n][matches] = False
+            self.dirty = True
+        return killed
+    
+    def compact(self):
+        if not self.dirty:
+            return
+        
+        n = self.count
+        keep = np.flatnonzero(self.alive[:n])
+        for _, array in self._arrays():
+            array[:len(keep)] = array[:n][keep]
+        
+        self.count = len(keep)
+        self.dirty = False
+    
+    def save_state(self):
+        n = self.count
+        return b"".join(getattr(self, name)[:n].tobytes() for name in STATE_FIELDS)
+    
+    def load_state(self, data, offset, count):
+        while self.capacity < count:
+            self._grow()
+        
+        for name in STATE_FIELDS:
+            array = getattr(self, name)
+            array[:count] = np.frombuffer(data, dtype=array.dtype, count=count, offset=offset)
+            offset += count * array.itemsize
+        
+        self.alive[:count] = True
+        self.count = count
+        self.dirty = False
+        return offset
+    
+    def snapshot(self):
+        n = self.count
+        return (
+            self.prev_x[:n].copy(),
+            self.prev_y[:n].copy(),
+            self.x[:n].copy(),
+            self.y[:n].copy(),
+            self.type_id[:n].copy(),
+        )
+    
+    def draw(self, surface, alpha=1.0):
+        n = self.count
+        return self.draw_arrays(surface, self.prev_x[:n], self.prev_y[:n], self.x[:n], self.y[:n], self.type_id[:n], alpha)
+    
+    def draw_arrays(self, surface, prev_x, prev_y, x, y, type_id, alpha=1.0):
+        if len(x) == 0:
+            return []
+        
+        if alpha >= 1.0:
+            xs = x
+            ys = y
+        else:
+            xs = prev_x + ((x - prev_x) * alpha).astype(np.int32)
+            ys = prev_y + ((y - prev_y) * alpha).astype(np.int32)
+        
+        images = self.images
+        return surface.blits([
+            (images[i], (px, py))
+            for px, py, i in zip(xs.tolist(), ys.tolist(), type_id.tolist())
+        ])
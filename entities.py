@@ -1,32 +1,45 @@
-import pygame
 import random
+from asset_cache import AssetCache
 from config import GameConfig
 
 config = GameConfig()
 
 
 class Entity:
-    def __init__(self, x, y, color=(200, 200, 200)):
-        self.image = pygame.Surface((config.entity.SIZE, config.entity.SIZE))
-        self.image.fill(color)
+    def __init__(self, x, y, color=(200, 200, 200), game_config=None):
+        self.config = game_config or config
+        self.image = AssetCache.get().get_solid(color, (self.config.entity.SIZE, self.config.entity.SIZE))
         self.rect = self.image.get_rect()
         self.rect.topleft = (x, y)
+        self.prev_x = x
+        self.prev_y = y
+        self.alive = True
+    
+    def save_previous_position(self):
+        self.prev_x = self.rect.x
+        self.prev_y = self.rect.y
     
     def update(self, game_manager):
         pass
     
-    def draw(self, surface):
-        surface.blit(self.image, self.rect)
+    def draw(self, surface, alpha=1.0):
+        if alpha >= 1.0:
+            return surface.blit(self.image, self.rect)
+        
+        x = self.prev_x + int((self.rect.x - self.prev_x) * alpha)
+        y = self.prev_y + int((self.rect.y - self.prev_y) * alpha)
+        return surface.blit(self.image, (x, y))
 
 
 class Player(Entity):
-    def __init__(self, x, y):
-        super().__init__(x, y, config.player.COLOR)
-        self.speed = config.player.SPEED_NORMAL
-        self.max_health = config.player.MAX_HEALTH
-        self.health = config.player.MAX_HEALTH
-        self.max_stamina = config.player.MAX_STAMINA
-        self.stamina = config.player.MAX_STAMINA
+    def __init__(self, x, y, game_config=None):
+        game_config = game_config or config
+        super().__init__(x, y, game_config.player.COLOR, game_config)
+        self.speed = self.config.player.SPEED_NORMAL
+        self.max_health = self.config.player.MAX_HEALTH
+        self.health = self.config.player.MAX_HEALTH
+        self.max_stamina = self.config.player.MAX_STAMINA
+        self.stamina = self.config.player.MAX_STAMINA
         self.damage_cooldown = 0
     
     def update(self, game_manager):
@@ -35,8 +48,7 @@ class Player(Entity):
         
         blue_active = game_manager.blue_powerup_timer > 0
         
-        keys = pygame.key.get_pressed()
-        move_x, move_y = self._get_movement_input(keys)
+        move_x, move_y = game_manager.input_source.get_movement(game_manager)
         
         speed = self._calculate_speed(move_x, move_y, blue_active)
         
@@ -44,27 +56,12 @@ class Player(Entity):
         
         self._clamp_to_screen()
     
-    def _get_movement_input(self, keys):
-        move_x = 0
-        move_y = 0
-        
-        if keys[pygame.K_w]:
-            move_y -= 1
-        if keys[pygame.K_s]:
-            move_y += 1
-        if keys[pygame.K_a]:
-            move_x -= 1
-        if keys[pygame.K_d]:
-            move_x += 1
-        
-        return move_x, move_y
-    
     def _calculate_speed(self, move_x, move_y, blue_active):
         is_moving = move_x != 0 or move_y != 0
         
         if is_moving:
             if self.stamina > 0:
-                drain = config.player.STAMINA_DRAIN_RATE / 2.0 if blue_active else config.player.STAMINA_DRAIN_RATE
+                drain = self.config.player.STAMINA_DRAIN_RATE / 2.0 if blue_active else self.config.player.STAMINA_DRAIN_RATE
                 self.stamina -= drain
                 
                 boost = 4 if blue_active else 2
@@ -74,7 +71,7 @@ class Player(Entity):
                 return self.speed + boost
         else:
             if self.stamina < self.max_stamina:
-                regen = config.player.STAMINA_REGEN_RATE * 2.5 if blue_active else config.player.STAMINA_REGEN_RATE
+                regen = self.config.player.STAMINA_REGEN_RATE * 2.5 if blue_active else self.config.player.STAMINA_REGEN_RATE
                 self.stamina = min(self.max_stamina, self.stamina + regen)
             return self.speed
     
@@ -85,19 +82,19 @@ class Player(Entity):
     def _clamp_to_screen(self):
         if self.rect.left < 0:
             self.rect.left = 0
-        if self.rect.right > config.width:
-            self.rect.right = config.width
+        if self.rect.right > self.config.width:
+            self.rect.right = self.config.width
         if self.rect.top < 0:
             self.rect.top = 0
-        if self.rect.bottom > config.height:
-            self.rect.bottom = config.height
+        if self.rect.bottom > self.config.height:
+            self.rect.bottom = self.config.height
     
     def take_damage(self, damage):
         if self.damage_cooldown > 0:
             return False
         
         self.health -= damage
-        self.damage_cooldown = config.player.DAMAGE_COOLDOWN
+        self.damage_cooldown = self.config.player.DAMAGE_COOLDOWN
         return self.health <= 0
     
     def heal(self, amount):
@@ -105,17 +102,27 @@ class Player(Entity):
 
 
 class Enemy(Entity):
-    def __init__(self, x, y, color, speed, enemy_type):
-        super().__init__(x, y, color)
-        self.color = color
-        self.speed = speed
-        self.enemy_type = enemy_type
-        self.damage = config.collision.DAMAGE_AMOUNT
+    def __init__(self, x, y, archetype, rng=random, phase=0, game_config=None):
+        super().__init__(x, y, archetype.color, game_config)
+        self.damage = self.config.collision.DAMAGE_AMOUNT
+        self.reset(x, y, archetype, rng, phase)
+    
+    def reset(self, x, y, archetype, rng=random, phase=0):
+        self.image = AssetCache.get().get_solid(archetype.color, (self.config.entity.SIZE, self.config.entity.SIZE))
+        self.rect.topleft = (x, y)
+        self.prev_x = x
+        self.prev_y = y
+        self.type_id = archetype.type_id
+        self.color = archetype.color
+        self.speed = archetype.speed
+        self.enemy_type = archetype.movement
         self.confused = 0
+        self.phase = phase
+        self.needs_target = True
         
-        if enemy_type == "bounce":
-            self.vx = random.choice([-1, 1]) * speed
-            self.vy = random.choice([-1, 1]) * speed
+        if self.enemy_type == "bounce":
+            self.vx = rng.choice([-1, 1]) * self.speed
+            self.vy = rng.choice([-1, 1]) * self.speed
         else:
             self.vx = 0
             self.vy = 0
@@ -135,34 +142,34 @@ class Enemy(Entity):
     def _update_tracking(self, game_manager):
         if self.confused > 0:
             self.confused -= 1
+            if self.confused == 0:
+                self.needs_target = True
             return
         
-        player = game_manager.get_player()
-        if not player:
+        tracking = game_manager.tracking
+        if not self.needs_target and not tracking.should_retarget(self.phase):
             return
         
-        dx = player.rect.centerx - self.rect.centerx
-        dy = player.rect.centery - self.rect.centery
+        direction = tracking.direction_at(self.rect.centerx, self.rect.centery)
+        if direction is None:
+            return
         
-        if abs(dx) > abs(dy):
-            self.vx = self.speed if dx > 0 else -self.speed
-            self.vy = 0
-        else:
-            self.vy = self.speed if dy > 0 else -self.speed
-            self.vx = 0
+        self.needs_target = False
+        self.vx = direction[0] * self.speed
+        self.vy = direction[1] * self.speed
     
     def _handle_wall_collisions(self):
         if self.rect.left <= 0:
             self.rect.left = 0
             self.vx = abs(self.vx)
-        if self.rect.right >= config.width:
-            self.rect.right = config.width
+        if self.rect.right >= self.config.width:
+            self.rect.right = self.config.width
             self.vx = -abs(self.vx)
         if self.rect.top <= 0:
             self.rect.top = 0
             self.vy = abs(self.vy)
-        if self.rect.bottom >= config.height:
-            self.rect.bottom = config.height
+        if self.rect.bottom >= self.config.height:
+            self.rect.bottom = self.config.height
             self.vy = -abs(self.vy)
     
     def confuse(self, duration):
@@ -0,0 +1,58 @@
+from entities import Player, Enemy
+
+
+class EntityRegistry:
+    def __init__(self):
+        self.clear()
+    
+    def clear(self):
+        self.entities = []
+        self.player = None
+        self.enemies = []
+        self.enemies_by_type = {}
+        self.pending_removals = []
+    
+    def add(self, entity):
+        entity.alive = True
+        self.entities.append(entity)
+        
+        if isinstance(entity, Player):
+            self.player = entity
+        elif isinstance(entity, Enemy):
+            self.enemies.append(entity)
+            self.enemies_by_type.setdefault(entity.type_id, []).append(entity)
+    
+    def kill(self, entity):
+        if not entity.alive:
+            return False
+        
+        entity.alive = False
+        self.pending_removals.append(entity)
+        return True
+    
+    def kill_all(self, entities):
+        killed = 0
+        for entity in entities:
+            if self.kill(entity):
+                killed += 1
+        return killed
+    
+    def flush(self):
+        if not self.pending_removals:
+            return []
+        
+        removed = self.pending_removals
+        self.pending_removals = []
+        
+        if self.player is not None and not self.player.alive:
+            self.player = None
+        
+        self.entities[:] = [e for e in self.entities if e.alive]
+        self.enemies[:] = [e for e in self.enemies if e.alive]
+        for group in self.enemies_by_type.values():
+            group[:] = [e for e in group if e.alive]
+        
+        return removed
+    
+    def get_enemies_by_type(self, type_id):
+        return self.enemies_by_type.get(type_id, [])
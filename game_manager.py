@@ -1,29 +1,67 @@
 import pygame
 import random
+from functools import partial
 from entities import Player, Enemy
+from entity_registry import EntityRegistry
+from archetypes import ArchetypeRegistry
+from audio_manager import NullAudioManager
 from collision_handler import CollisionHandler
-from highscore_manager import HighScoreManager
+from enemy_store import create_enemy_store
+from input_source import KeyboardInput, NullInput
+from leaderboard import Leaderboard
+from object_pool import ObjectPool
 from powerup import PowerUp
+from profiler import FrameProfiler
+from save_state import decode_state, encode_state
+from snapshot import FrameSnapshot, HudState
+from startup import AssetLoader
+from text_cache import TextCache
+from tracking import TrackingField
 from config import GameConfig
 
 config = GameConfig()
 
 
 class GameManager:
-    _instance = None
-    
-    def __init__(self):
-        self.screen = pygame.display.set_mode((config.width, config.height))
-        pygame.display.set_caption("Pygame Survival Game")
-        self.clock = pygame.time.Clock()
-        
-        self.font = pygame.font.SysFont(None, config.ui.FONT_SIZE_NORMAL)
-        self.big_font = pygame.font.SysFont(None, config.ui.FONT_SIZE_LARGE)
-        
-        self.entities = []
+    def __init__(self, headless=False, input_source=None, seed=None, preload=True, game_config=None, screen=None):
+        self.config = game_config or config
+        self.headless = headless
+        self.seed_sequence = random.Random(seed)
+        self.seed = None
+        self.rng = random.Random()
+        
+        if headless:
+            self.screen = None
+            self.clock = None
+            self.font = None
+            self.big_font = None
+            self.text_cache = None
+            self.audio_manager = NullAudioManager()
+            self.input_source = input_source or NullInput()
+        else:
+            if screen is None:
+                screen = pygame.display.set_mode((self.config.width, self.config.height))
+                pygame.display.set_caption("Pygame Survival Game")
+            self.screen = screen
+            self.clock = pygame.time.Clock()
+            self.font = None
+            self.big_font = None
+            self.text_cache = TextCache(self.config.ui.TEXT_CACHE_SIZE)
+            self.audio_manager = NullAudioManager()
+            self.input_source = input_source or KeyboardInput()
+        
+        self.archetypes = ArchetypeRegistry(
+            self.config.enemy.ARCHETYPES,
+            self.config.collision.STRENGTH,
+            self.config.collision.HEAL
+        )
+        self.registry = EntityRegistry()
+        self.enemy_pool = ObjectPool(partial(Enemy, game_config=self.config), self.config.pool.ENEMY_CAP)
+        self.powerup_pool = ObjectPool(partial(PowerUp, game_config=self.config), self.config.pool.POWERUP_CAP)
         self.powerups = []
         self.state = "menu"
         self.score = 0
+        self.kills = {}
         
         self.spawn_timer = 0
         self.powerup_spawn_timer = 0
@@ -33,22 +71,65 @@ class GameManager:
         self.blue_powerup_timer = 0
         self.yellow_powerup_timer = 0
         
+        self.enemy_store = create_enemy_store(self.archetypes, self.config)
+        self.tracking = TrackingField(game_config=self.config)
+        self.profiler = FrameProfiler(
+            self.config.profiler.ENABLED, self.config.profiler.HISTORY_FRAMES, self.config)
         self.collision_handler = CollisionHandler(self)
-        self.highscore_manager = HighScoreManager()
+        self.profile = self.config.leaderboard.DEFAULT_PROFILE
+        self.leaderboard = Leaderboard(None, self.config.leaderboard.MAX_ENTRIES, game_config=self.config)
+        self.loader = None
+        self.assets_ready = headless
+        self.history = None
+        
+        if not headless and preload:
+            self.load_assets()
+    
+    def load_assets(self, startup=None, background=False):
+        self.loader = AssetLoader(startup, self.config.leaderboard.FILE, self.config)
+        self.font, self.big_font = self.loader.load_fonts()
+        if background:
+            self.loader.start()
+            return
+        
+        self.loader.run()
+        self.poll_assets()
     
-    @classmethod
-    def get(cls):
-        if not cls._instance:
-            cls._instance = GameManager()
-        return cls._instance
+    def poll_assets(self, block=False):
+        if self.assets_ready or self.loader is None:
+            return False
+        
+        if not block and not self.loader.ready:
+            return False
+        
+        self.loader.wait()
+        self.audio_manager = self.loader.audio_manager
+        self.leaderboard = self.loader.leaderboard
+        self.assets_ready = True
+        return True
+    
+    @property
+    def entities(self):
+        return self.registry.entities
     
     def add_entity(self, entity):
-        self.entities.append(entity)
+        self.registry.add(entity)
+    
+    def remove_entity(self, entity):
+        return self.registry.kill(entity)
     
-    def reset_game(self):
-        self.entities = []
+    def reset_game(self, seed=None):
+        if seed is None:
+            seed = self.seed_sequence.getrandbits(32)
+        self.seed = seed
+        self.rng.seed(seed)
+        
+        self.enemy_pool.release_all(self.registry.enemies)
+        self.powerup_pool.release_all(self.powerups)
+        self.registry.clear()
         self.powerups = []
         self.score = 0
+        self.kills = {}
         self.spawn_timer = 0
         self.powerup_spawn_timer = 0
         self.difficulty = 1.0
@@ -56,8 +137,15 @@ class GameManager:
         self.blue_powerup_timer = 0
         self.yellow_powerup_timer = 0
         
-        player = Player(config.width // 2, config.height // 2)
+        if self.enemy_store is not None:
+            self.enemy_store.clear()
+        self.tracking.reset()
+        if self.history is not None:
+            self.history.clear()
+        
+        player = Player(self.config.width // 2, self.config.height // 2, self.config)
         self.add_entity(player)
+        self.input_source.reset(self)
     
     def update(self):
         if self.state != "game":
@@ -65,17 +153,56 @@ class GameManager:
         
         self.score += 1
         
+        self._save_previous_positions()
         self._update_timers()
         
+        self.profiler.start("spawning")
         self._handle_enemy_spawning()
         
         self._handle_powerup_spawning()
+        self.profiler.stop("spawning")
         
+        self.profiler.start("entities")
+        self.tracking.begin_tick(self.get_player())
         for entity in self.entities:
             entity.update(self)
         
-        self.collision_handler.check_all_collisions()
-        self.check_powerup_collisions()
+        if self.enemy_store is not None:
+            self.enemy_store.update(self)
+        self.profiler.stop("entities")
+        
+        self.profiler.start("collisions")
+        fatal = self.collision_handler.check_all_collisions()
+        self.profiler.stop("collisions")
+        
+        if not fatal:
+            self.profiler.start("powerups")
+            self.check_powerup_collisions()
+            self.profiler.stop("powerups")
+        
+        self._release_removed(self.registry.flush())
+        self.audio_manager.flush()
+        
+        if self.history is not None:
+            self.history.push(self.save_state())
+    
+    def save_state(self):
+        return encode_state(self)
+    
+    def load_state(self, data):
+        decode_state(self, data)
+    
+    def _save_previous_positions(self):
+        for entity in self.entities:
+            entity.save_previous_position()
+        
+        if self.enemy_store is not None:
+            self.enemy_store.save_previous_positions()
+    
+    def _release_removed(self, removed):
+        for entity in removed:
+            if isinstance(entity, Enemy):
+                self.enemy_pool.release(entity)
     
     def _update_timers(self):
         self.spawn_timer += 1
@@ -91,180 +218,274 @@ class GameManager:
             self.yellow_powerup_timer -= 1
     
     def _handle_enemy_spawning(self):
-        spawn_rate = config.spawn.RATE_BASE - int(self.difficulty * config.spawn.DIFFICULTY_MULTIPLIER)
-        spawn_rate = max(config.spawn.RATE_MIN, spawn_rate)
+        spawn_rate = self.config.spawn.RATE_BASE - int(self.difficulty * self.config.spawn.DIFFICULTY_MULTIPLIER)
+        spawn_rate = max(self.config.spawn.RATE_MIN, spawn_rate)
         
         if self.spawn_timer > spawn_rate:
             self.spawn_enemy()
             self.spawn_timer = 0
-            self.difficulty += config.spawn.DIFFICULTY_INCREASE
+            self.difficulty += self.config.spawn.DIFFICULTY_INCREASE
     
     def _handle_powerup_spawning(self):
-        spawn_rate = random.randint(config.spawn.POWERUP_SPAWN_MIN, config.spawn.POWERUP_SPAWN_MAX)
+        spawn_rate = self.rng.randint(self.config.spawn.POWERUP_SPAWN_MIN, self.config.spawn.POWERUP_SPAWN_MAX)
         
         if self.powerup_spawn_timer > spawn_rate:
             self.spawn_powerup()
             self.powerup_spawn_timer = 0
     
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0):
         if self.state == "menu":
-            self._draw_menu(surface)
+            return self._draw_menu(surface)
         elif self.state == "game":
-            self._draw_game(surface)
+            return self._draw_game(surface, alpha)
         elif self.state == "gameover":
-            self._draw_game(surface)
-            self._draw_gameover(surface)
+            return self._draw_game(surface) + self._draw_gameover(surface)
+        return []
     
-    def _draw_menu(self, surface):
-        title = self.big_font.render("PRESS SPACE TO START", True, config.ui.COLOR_TEXT)
-        title_rect = title.get_rect(center=(config.width // 2, config.height // 2 - 40))
+    def _draw_menu(self, surface, high_score=None):
+        if self.font is None:
+            return []
+        
+        if high_score is None:
+            high_score = self.leaderboard.get_high_score(self.profile)
+        
+        title = self.text_cache.render(self.big_font, "PRESS SPACE TO START", self.config.ui.COLOR_TEXT)
+        title_rect = title.get_rect(center=(self.config.width // 2, self.config.height // 2 - 40))
         surface.blit(title, title_rect)
         
-        high_score_text = "High Score: {}".format(self.highscore_manager.get_high_score())
-        high_score = self.font.render(high_score_text, True, config.ui.COLOR_TEXT)
-        high_score_rect = high_score.get_rect(center=(config.width // 2, config.height // 2 + 40))
+        high_score_text = "High Score: {}".format(high_score)
+        high_score = self.text_cache.render(self.font, high_score_text, self.config.ui.COLOR_TEXT)
+        high_score_rect = high_score.get_rect(center=(self.config.width // 2, self.config.height // 2 + 40))
         surface.blit(high_score, high_score_rect)
+        
+        return [title_rect, high_score_rect]
     
-    def _draw_game(self, surface):
+    def _draw_game(self, surface, alpha=1.0):
+        rects = []
+        
         for entity in self.entities:
-            entity.draw(surface)
+            rects.append(entity.draw(surface, alpha))
+        
+        if self.enemy_store is not None:
+            rects.extend(self.enemy_store.draw(surface, alpha))
         
         for powerup in self.powerups:
-            powerup.draw(surface)
+            rects.append(powerup.draw(surface))
+        
+        rects.extend(self._draw_hud(surface, self._hud_state()))
+        rects.extend(self.profiler.draw_overlay(surface))
+        return rects
+    
+    def capture_snapshot(self):
+        sprites = tuple(
+            (entity.image, entity.prev_x, entity.prev_y, entity.rect.x, entity.rect.y)
+            for entity in self.entities
+        )
+        powerups = tuple((powerup.image, powerup.rect.topleft) for powerup in self.powerups)
+        enemies = self.enemy_store.snapshot() if self.enemy_store is not None else None
+        
+        return FrameSnapshot(
+            self.state,
+            sprites,
+            enemies,
+            powerups,
+            self._hud_state(),
+            self.leaderboard.get_high_score(self.profile)
+        )
+    
+    def draw_snapshot(self, surface, snapshot, alpha=1.0):
+        if snapshot.state == "menu":
+            return self._draw_menu(surface, snapshot.high_score)
+        elif snapshot.state == "game":
+            return self._draw_game_snapshot(surface, snapshot, alpha)
+        elif snapshot.state == "gameover":
+            return self._draw_game_snapshot(surface, snapshot) + self._draw_gameover(surface)
+        return []
+    
+    def _draw_game_snapshot(self, surface, snapshot, alpha=1.0):
+        rects = []
+        
+        for image, prev_x, prev_y, x, y in snapshot.sprites:
+            if alpha < 1.0:
+                x = prev_x + int((x - prev_x) * alpha)
+                y = prev_y + int((y - prev_y) * alpha)
+            rects.append(surface.blit(image, (x, y)))
+        
+        if snapshot.enemies is not None:
+            rects.extend(self.enemy_store.draw_arrays(surface, *snapshot.enemies, alpha=alpha))
         
-        self._draw_ui(surface)
+        for image, position in snapshot.powerups:
+            rects.append(surface.blit(image, position))
+        
+        rects.extend(self._draw_hud(surface, snapshot.hud))
+        rects.extend(self.profiler.draw_overlay(surface))
+        return rects
     
     def _draw_gameover(self, surface):
-        game_over = self.big_font.render("GAME OVER", True, (255, 50, 50))
-        game_over_rect = game_over.get_rect(center=(config.width // 2, config.height // 2 - 60))
+        game_over = self.text_cache.render(self.big_font, "GAME OVER", (255, 50, 50))
+        game_over_rect = game_over.get_rect(center=(self.config.width // 2, self.config.height // 2 - 60))
         surface.blit(game_over, game_over_rect)
         
-        restart = self.font.render("Press SPACE to restart", True, config.ui.COLOR_TEXT)
-        restart_rect = restart.get_rect(center=(config.width // 2, config.height // 2 + 20))
+        restart = self.text_cache.render(self.font, "Press SPACE to restart", self.config.ui.COLOR_TEXT)
+        restart_rect = restart.get_rect(center=(self.config.width // 2, self.config.height // 2 + 20))
         surface.blit(restart, restart_rect)
+        
+        return [game_over_rect, restart_rect]
     
-    def _draw_ui(self, surface):
+    def _hud_state(self):
         player = self.get_player()
         if player is None:
-            return
+            return None
         
-        self._draw_bar(
-            surface,
-            config.ui.HEALTH_BAR_X,
-            config.ui.HEALTH_BAR_Y,
-            config.ui.HEALTH_BAR_WIDTH,
-            config.ui.HEALTH_BAR_HEIGHT,
+        return HudState(
             player.health / float(player.max_health),
-            config.ui.COLOR_HEALTH_BG,
-            config.ui.COLOR_HEALTH_FG
+            player.stamina / float(player.max_stamina),
+            self.score,
+            self.red_powerup_timer,
+            self.blue_powerup_timer,
+            self.yellow_powerup_timer
         )
+    
+    def _draw_hud(self, surface, hud):
+        if hud is None:
+            return []
         
-        self._draw_bar(
+        health_rect = self._draw_bar(
             surface,
-            config.ui.STAMINA_BAR_X,
-            config.ui.STAMINA_BAR_Y,
-            config.ui.STAMINA_BAR_WIDTH,
-            config.ui.STAMINA_BAR_HEIGHT,
-            player.stamina / float(player.max_stamina),
-            config.ui.COLOR_STAMINA_BG,
-            config.ui.COLOR_STAMINA_FG
+            self.config.ui.HEALTH_BAR_X,
+            self.config.ui.HEALTH_BAR_Y,
+            self.config.ui.HEALTH_BAR_WIDTH,
+            self.config.ui.HEALTH_BAR_HEIGHT,
+            hud.health_ratio,
+            self.config.ui.COLOR_HEALTH_BG,
+            self.config.ui.COLOR_HEALTH_FG
         )
         
-        score_text = self.font.render("Score: {}".format(self.score), True, config.ui.COLOR_TEXT)
-        score_x = config.width - config.ui.SCORE_MARGIN - score_text.get_width()
-        surface.blit(score_text, (score_x, config.ui.SCORE_MARGIN))
+        stamina_rect = self._draw_bar(
+            surface,
+            self.config.ui.STAMINA_BAR_X,
+            self.config.ui.STAMINA_BAR_Y,
+            self.config.ui.STAMINA_BAR_WIDTH,
+            self.config.ui.STAMINA_BAR_HEIGHT,
+            hud.stamina_ratio,
+            self.config.ui.COLOR_STAMINA_BG,
+            self.config.ui.COLOR_STAMINA_FG
+        )
+        
+        score_rect = self.text_cache.draw_number(
+            surface,
+            self.font,
+            "Score: ",
+            hud.score,
+            self.config.ui.COLOR_TEXT,
+            (self.config.width - self.config.ui.SCORE_MARGIN, self.config.ui.SCORE_MARGIN)
+        )
         
-        self._draw_powerup_timers(surface)
+        return [health_rect, stamina_rect, score_rect] + self._draw_powerup_timers(surface, hud)
     
     def _draw_bar(self, surface, x, y, width, height, fill_ratio, bg_color, fg_color):
-        pygame.draw.rect(surface, bg_color, (x, y, width, height))
+        bar_rect = pygame.draw.rect(surface, bg_color, (x, y, width, height))
         
         fill_width = int(width * max(0.0, min(1.0, fill_ratio)))
         pygame.draw.rect(surface, fg_color, (x, y, fill_width, height))
-    
-    def _draw_powerup_timers(self, surface):
-        y_offset = config.ui.POWERUP_TIMER_Y_START
-        
-        if self.red_powerup_timer > 0:
-            seconds = self.red_powerup_timer // config.fps
-            text = self.font.render("RED: {}".format(seconds), True, config.enemy.COLOR_RED)
-            text_rect = text.get_rect(center=(config.width // 2, y_offset))
-            surface.blit(text, text_rect)
-            y_offset += config.ui.POWERUP_TIMER_Y_OFFSET
         
-        if self.blue_powerup_timer > 0:
-            seconds = self.blue_powerup_timer // config.fps
-            text = self.font.render("BLUE: {}".format(seconds), True, config.player.COLOR)
-            text_rect = text.get_rect(center=(config.width // 2, y_offset))
-            surface.blit(text, text_rect)
-            y_offset += config.ui.POWERUP_TIMER_Y_OFFSET
-        
-        if self.yellow_powerup_timer > 0:
-            seconds = self.yellow_powerup_timer // config.fps
-            text = self.font.render("YELLOW: {}".format(seconds), True, (255, 255, 0))
-            text_rect = text.get_rect(center=(config.width // 2, y_offset))
-            surface.blit(text, text_rect)
+        return bar_rect
+    
+    def _draw_powerup_timers(self, surface, hud):
+        rects = []
+        y_offset = self.config.ui.POWERUP_TIMER_Y_START
+        
+        if hud.red_timer > 0:
+            seconds = hud.red_timer // self.config.fps
+            text = self.text_cache.render(self.font, "RED: {}".format(seconds), self.config.enemy.COLOR_RED)
+            text_rect = text.get_rect(center=(self.config.width // 2, y_offset))
+            rects.append(surface.blit(text, text_rect))
+            y_offset += self.config.ui.POWERUP_TIMER_Y_OFFSET
+        
+        if hud.blue_timer > 0:
+            seconds = hud.blue_timer // self.config.fps
+            text = self.text_cache.render(self.font, "BLUE: {}".format(seconds), self.config.player.COLOR)
+            text_rect = text.get_rect(center=(self.config.width // 2, y_offset))
+            rects.append(surface.blit(text, text_rect))
+            y_offset += self.config.ui.POWERUP_TIMER_Y_OFFSET
+        
+        if hud.yellow_timer > 0:
+            seconds = hud.yellow_timer // self.config.fps
+            text = self.text_cache.render(self.font, "YELLOW: {}".format(seconds), (255, 255, 0))
+            text_rect = text.get_rect(center=(self.config.width // 2, y_offset))
+            rects.append(surface.blit(text, text_rect))
+        
+        return rects
     
     def get_player(self):
-        for entity in self.entities:
-            if isinstance(entity, Player):
-                return entity
-        return None
+        return self.registry.player
+    
+    def get_enemy_count(self):
+        if self.enemy_store is not None:
+            return len(self.enemy_store)
+        return len(self.registry.enemies)
+    
+    def get_enemy_centers(self):
+        if self.enemy_store is not None:
+            return self.enemy_store.centers()
+        return [enemy.rect.center for enemy in self.registry.enemies]
+    
+    def get_pool_stats(self):
+        return {
+            "enemies": self.enemy_pool.get_stats(),
+            "powerups": self.powerup_pool.get_stats(),
+        }
+    
+    def record_kill(self, color, count=1):
+        self.kills[color] = self.kills.get(color, 0) + count
     
     def game_over(self):
-        self.highscore_manager.save(self.score)
+        if not self.headless:
+            self.leaderboard.submit(
+                self.profile,
+                self.score,
+                duration=self.score / float(self.config.fps),
+                difficulty=self.difficulty,
+                seed=self.seed
+            )
         self.state = "gameover"
     
     def spawn_enemy(self):
-        rand = random.random()
-        
-        if rand < config.enemy.SPAWN_PROB_RED:
-            color = config.enemy.COLOR_RED
-            speed = config.enemy.SPEED_SLOW
-            enemy_type = "bounce"
-        elif rand < config.enemy.SPAWN_PROB_RED + config.enemy.SPAWN_PROB_ORANGE:
-            color = config.enemy.COLOR_ORANGE
-            speed = config.enemy.SPEED_FAST
-            enemy_type = "bounce"
-        elif rand < config.enemy.SPAWN_PROB_RED + config.enemy.SPAWN_PROB_ORANGE + config.enemy.SPAWN_PROB_GREEN:
-            color = config.enemy.COLOR_GREEN
-            speed = config.enemy.SPEED_SLOW
-            enemy_type = "track"
-        else:
-            color = config.enemy.COLOR_PURPLE
-            speed = config.enemy.SPEED_FAST
-            enemy_type = "bounce"
+        archetype = self.archetypes.pick(self.rng)
         
-        side = random.choice(["top", "bottom", "left", "right"])
+        side = self.rng.choice(["top", "bottom", "left", "right"])
         
         if side == "top":
-            x, y = random.randint(0, config.width), 0
+            x, y = self.rng.randint(0, self.config.width), 0
         elif side == "bottom":
-            x, y = random.randint(0, config.width), config.height - config.entity.SIZE
+            x, y = self.rng.randint(0, self.config.width), self.config.height - self.config.entity.SIZE
         elif side == "left":
-            x, y = 0, random.randint(0, config.height)
+            x, y = 0, self.rng.randint(0, self.config.height)
         else:
-            x, y = config.width - config.entity.SIZE, random.randint(0, config.height)
+            x, y = self.config.width - self.config.entity.SIZE, self.rng.randint(0, self.config.height)
         
-        self.add_entity(Enemy(x, y, color, speed, enemy_type))
+        if self.enemy_store is not None:
+            self.enemy_store.add(x, y, archetype, self.rng, self.tracking.next_phase())
+        else:
+            self.add_entity(self.enemy_pool.acquire(x, y, archetype, self.rng, self.tracking.next_phase()))
     
     def spawn_powerup(self):
-        margin = config.powerup.SPAWN_MARGIN
-        x = random.randint(margin, config.width - margin)
-        y = random.randint(margin, config.height - margin)
+        margin = self.config.powerup.SPAWN_MARGIN
+        x = self.rng.randint(margin, self.config.width - margin)
+        y = self.rng.randint(margin, self.config.height - margin)
         
-        rand = random.random()
+        rand = self.rng.random()
         
-        if rand < config.powerup.SPAWN_PROB_BLUE:
+        if rand < self.config.powerup.SPAWN_PROB_BLUE:
             powerup_type = "blue"
-        elif rand < config.powerup.SPAWN_PROB_BLUE + config.powerup.SPAWN_PROB_GREEN:
+        elif rand < self.config.powerup.SPAWN_PROB_BLUE + self.config.powerup.SPAWN_PROB_GREEN:
             powerup_type = "green"
-        elif rand < config.powerup.SPAWN_PROB_BLUE + config.powerup.SPAWN_PROB_GREEN + config.powerup.SPAWN_PROB_RED:
+        elif rand < self.config.powerup.SPAWN_PROB_BLUE + self.config.powerup.SPAWN_PROB_GREEN + self.config.powerup.SPAWN_PROB_RED:
             powerup_type = "red"
         else:
             powerup_type = "yellow"
         
-        self.powerups.append(PowerUp(x, y, powerup_type))
+        self.powerups.append(self.powerup_pool.acquire(x, y, powerup_type))
     
     def check_powerup_collisions(self):
         player = self.get_player()
@@ -280,21 +501,26 @@ class GameManager:
         
         for powerup in powerups_to_remove:
             self.powerups.remove(powerup)
+            self.powerup_pool.release(powerup)
     
     def apply_powerup(self, player, powerup_type):
         if powerup_type == "blue":
-            self.blue_powerup_timer = config.powerup.DURATION
+            self.blue_powerup_timer = self.config.powerup.DURATION
         
         elif powerup_type == "green":
-            enemies_to_remove = [
-                entity for entity in self.entities
-                if isinstance(entity, Enemy) and entity.color == config.enemy.COLOR_GREEN
-            ]
-            for enemy in enemies_to_remove:
-                self.entities.remove(enemy)
+            green_type = self.archetypes.type_id_for_color(self.config.enemy.COLOR_GREEN)
+            if self.enemy_store is not None:
+                killed = self.enemy_store.kill_type(green_type)
+                self.enemy_store.compact()
+                if killed:
+                    self.record_kill(self.config.enemy.COLOR_GREEN, killed)
+            
+            killed = self.registry.kill_all(self.registry.get_enemies_by_type(green_type))
+            if killed:
+                self.record_kill(self.config.enemy.COLOR_GREEN, killed)
         
         elif powerup_type == "yellow":
-            self.yellow_powerup_timer = config.powerup.DURATION
+            self.yellow_powerup_timer = self.config.powerup.DURATION
         
         elif powerup_type == "red":
-            self.red_powerup_timer = config.powerup.DURATION
+            self.red_powerup_timer = self.config.powerup.DURATION
@@ -0,0 +1,120 @@
+import random
+import pygame
+
+
+class KeyboardInput:
+    def reset(self, game_manager):
+        pass
+    
+    def get_movement(self, game_manager):
+        keys = pygame.key.get_pressed()
+        move_x = 0
+        move_y = 0
+        
+        if keys[pygame.K_w]:
+            move_y -= 1
+        if keys[pygame.K_s]:
+            move_y += 1
+        if keys[pygame.K_a]:
+            move_x -= 1
+        if keys[pygame.K_d]:
+            move_x += 1
+        
+        return move_x, move_y
+
+
+class NullInput:
+    def reset(self, game_manager):
+        pass
+    
+    def get_movement(self, game_manager):
+        return 0, 0
+
+
+class ScriptedInput:
+    def __init__(self, moves, loop=False):
+        self.moves = list(moves)
+        self.loop = loop
+        self.frame = 0
+    
+    def reset(self, game_manager):
+        self.frame = 0
+    
+    def get_movement(self, game_manager):
+        if not self.moves:
+            return 0, 0
+        
+        if self.frame < len(self.moves):
+            move = self.moves[self.frame]
+        elif self.loop:
+            move = self.moves[self.frame % len(self.moves)]
+        else:
+            move = (0, 0)
+        
+        self.frame += 1
+        return move
+
+
+class RandomInput:
+    DIRECTIONS = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+    
+    def __init__(self, rng=None, hold_frames=15):
+        self.rng = rng or random.Random()
+        self.hold_frames = hold_frames
+        self.frames_left = 0
+        self.move = (0, 0)
+    
+    def reset(self, game_manager):
+        self.frames_left = 0
+        self.move = (0, 0)
+    
+    def get_movement(self, game_manager):
+        if self.frames_left <= 0:
+            self.move = self.rng.choice(self.DIRECTIONS)
+            self.frames_left = self.hold_frames
+        
+        self.frames_left -= 1
+        return self.move
+
+
+class EvadeInput:
+    def __init__(self, wall_margin=None):
+        self.wall_margin = wall_margin
+    
+    def reset(self, game_manager):
+        pass
+    
+    def get_movement(self, game_manager):
+        player = game_manager.get_player()
+        if player is None:
+            return 0, 0
+        
+        px, py = player.rect.center
+        nearest = None
+        nearest_distance = None
+        
+        for cx, cy in game_manager.get_enemy_centers():
+            distance = (cx - px) * (cx - px) + (cy - py) * (cy - py)
+            if nearest_distance is None or distance < nearest_distance:
+                nearest = (cx, cy)
+                nearest_distance = distance
+        
+        if nearest is None:
+            return 0, 0
+        
+        game_config = game_manager.config
+        margin = self.wall_margin if self.wall_margin is not None else game_config.entity.SIZE * 2
+        move_x = self._away(px, nearest[0], game_config.width, margin)
+        move_y = self._away(py, nearest[1], game_config.height, margin)
+        return move_x, move_y
+    
+    def _away(self, position, threat, limit, margin):
+        if position < margin:
+            return 1
+        if position > limit - margin:
+            return -1
+        if threat > position:
+            return -1
+        if threat < position:
+            return 1
+        return 0
@@ -0,0 +1,234 @@
+import bisect
+import json
+import logging
+import os
+import queue
+import tempfile
+import threading
+import time
+from config import GameConfig
+
+config = GameConfig()
+
+LEADERBOARD_VERSION = 1
+
+
+class LeaderboardEntry:
+    __slots__ = ("score", "timestamp", "duration", "difficulty", "seed")
+    
+    def __init__(self, score, timestamp, duration=0.0, difficulty=1.0, seed=None):
+        self.score = score
+        self.timestamp = timestamp
+        self.duration = duration
+        self.difficulty = difficulty
+        self.seed = seed
+    
+    def to_dict(self):
+        return {
+            "score": self.score,
+            "timestamp": self.timestamp,
+            "duration": self.duration,
+            "difficulty": self.difficulty,
+            "seed": self.seed,
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            int(data["score"]),
+            float(data.get("timestamp", 0.0)),
+            float(data.get("duration", 0.0)),
+            float(data.get("difficulty", 1.0)),
+            data.get("seed")
+        )
+
+
+def atomic_write(filename, data):
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, temp_name = tempfile.mkstemp(prefix=".leaderboard-", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'wb' if isinstance(data, bytes) else 'w') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_name, filename)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+    
+    if hasattr(os, "O_DIRECTORY"):
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+
+
+class LeaderboardWriter(threading.Thread):
+    def __init__(self, filename, batch_seconds=None):
+        super().__init__(name="leaderboard-writer", daemon=True)
+        self.filename = filename
+        self.batch_seconds = config.leaderboard.WRITE_BATCH_SECONDS if batch_seconds is None else batch_seconds
+        self.queue = queue.Queue()
+        self.writes = 0
+        self.batched = 0
+    
+    def schedule(self, payload):
+        self.queue.put(payload)
+    
+    def close(self):
+        self.queue.put(None)
+        self.join()
+    
+    def run(self):
+        while True:
+            payload = self.queue.get()
+            if payload is None:
+                return
+            
+            closing = False
+            deadline = time.monotonic() + self.batch_seconds
+            while True:
+                remaining = deadline - time.monotonic()
+                try:
+                    newer = self.queue.get(timeout=remaining) if remaining > 0 else self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if newer is None:
+                    closing = True
+                    break
+                payload = newer
+                self.batched += 1
+            
+            self._write(payload)
+            if closing:
+                return
+    
+    def _write(self, payload):
+        try:
+            atomic_write(self.filename, payload)
+            self.writes += 1
+        except (IOError, OSError) as e:
+            logging.error("Failed to save leaderboard to '{}': {}".format(self.filename, e))
+
+
+class Leaderboard:
+    def __init__(self, filename=None, max_entries=None, legacy_filename=None, game_config=None):
+        self.config = game_config or config
+        self.filename = filename
+        self.max_entries = max_entries or self.config.leaderboard.MAX_ENTRIES
+        self.lock = threading.Lock()
+        self.profiles = {}
+        self.keys = {}
+        self.writer = None
+        
+        if filename is None:
+            return
+        
+        if not self._load():
+            self._import_legacy(legacy_filename or self.config.leaderboard.LEGACY_FILE)
+        
+        self.writer = LeaderboardWriter(filename, self.config.leaderboard.WRITE_BATCH_SECONDS)
+        self.writer.start()
+    
+    def _load(self):
+        try:
+            with open(self.filename, 'r') as f:
+                data = json.load(f)
+        except IOError:
+            return False
+        except ValueError as e:
+            logging.error("Failed to parse leaderboard '{}': {}".format(self.filename, e))
+            return False
+        
+        try:
+            for profile, entries in data.get("profiles", {}).items():
+                for entry in entries:
+                    self._insert(profile, LeaderboardEntry.from_dict(entry))
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            logging.error("Invalid leaderboard entry in '{}': {}".format(self.filename, e))
+        return True
+    
+    def _import_legacy(self, legacy_filename):
+        try:
+            with open(legacy_filename, 'r') as f:
+                score = int(f.read().strip())
+        except (IOError, ValueError):
+            return
+        
+        if score > 0:
+            self._insert(self.config.leaderboard.DEFAULT_PROFILE, LeaderboardEntry(score, time.time()))
+            logging.info("Imported high score {} from '{}'".format(score, legacy_filename))
+    
+    def _insert(self, profile, entry):
+        entries = self.profiles.setdefault(profile, [])
+        keys = self.keys.setdefault(profile, [])
+        
+        rank = bisect.bisect_right(keys, -entry.score)
+        if rank >= self.max_entries:
+            return None
+        
+        entries.insert(rank, entry)
+        keys.insert(rank, -entry.score)
+        del entries[self.max_entries:]
+        del keys[self.max_entries:]
+        return rank
+    
+    def _serialize(self):
+        return json.dumps({
+            "version": LEADERBOARD_VERSION,
+            "profiles": dict(
+                (profile, [entry.to_dict() for entry in entries])
+                for profile, entries in self.profiles.items()
+            ),
+        }, indent=2, sort_keys=True)
+    
+    def submit(self, profile, score, duration=0.0, difficulty=1.0, seed=None):
+        with self.lock:
+            rank = self._insert(profile, LeaderboardEntry(score, time.time(), duration, difficulty, seed))
+            if rank is None:
+                return None
+            payload = self._serialize() if self.writer is not None else None
+        
+        if payload is not None:
+            self.writer.schedule(payload)
+        
+        if rank == 0:
+            logging.info("New high score for '{}': {}".format(profile, score))
+        return rank
+    
+    def get_top(self, profile, count=None):
+        with self.lock:
+            entries = self.profiles.get(profile, [])
+            return list(entries[:count] if count is not None else entries)
+    
+    def get_high_score(self, profile):
+        with self.lock:
+            keys = self.keys.get(profile)
+            return -keys[0] if keys else 0
+    
+    def get_profiles(self):
+        with self.lock:
+            return sorted(self.profiles)
+    
+    def clear(self, profile):
+        with self.lock:
+            self.profiles.pop(profile, None)
+            self.keys.pop(profile, None)
+            payload = self._serialize() if self.writer is not None else None
+        
+        if payload is not None:
+            self.writer.schedule(payload)
+    
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
@@ -1,7 +1,17 @@
+import argparse
 import pygame
+import struct
 import sys
 import logging
+from asset_cache import AssetCache
 from game_manager import GameManager
+from leaderboard import atomic_write
+from renderer import create_renderer
+from pipeline import SimulationThread
+from replay import InputRecorder
+from save_state import create_history, load_state_file
+from startup import StartupProfiler
+from timestep import FixedTimestep
 from config import GameConfig
 
 logging.basicConfig(
@@ -11,30 +21,39 @@ logging.basicConfig(
 
 config = GameConfig()
 
+_rewind_warned = False
+
 
 def initialize_pygame():
     try:
-        pygame.init()
-        pygame.mixer.init()
+        pygame.display.init()
+        pygame.font.init()
         return True
     except pygame.error as e:
         logging.error("Failed to initialize pygame: {}".format(e))
         return False
 
 
-def handle_events(game_manager):
+def handle_events(game_manager, timestep, recorder):
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             return False
         
         if event.type == pygame.KEYDOWN:
             if game_manager.state == "menu" and event.key == pygame.K_SPACE:
-                game_manager.reset_game()
-                game_manager.state = "game"
+                start_run(game_manager, timestep)
             
             elif game_manager.state == "gameover" and event.key == pygame.K_SPACE:
-                game_manager.reset_game()
-                game_manager.state = "game"
+                start_run(game_manager, timestep)
+            
+            elif event.key == pygame.K_F3:
+                game_manager.profiler.toggle_overlay()
+            
+            elif event.key == pygame.K_F4:
+                game_manager.profiler.export_chrome_trace()
+            
+            elif event.key == pygame.K_F5 and game_manager.state == "game":
+                rewind(game_manager, timestep, recorder)
             
             elif event.key == pygame.K_ESCAPE:
                 return False
@@ -42,37 +61,196 @@ def handle_events(game_manager):
     return True
 
 
-def main():
-    if not initialize_pygame():
-        return 1
+def start_run(game_manager, timestep):
+    game_manager.poll_assets(block=True)
+    game_manager.reset_game()
+    timestep.reset()
+    game_manager.state = "game"
+    logging.info("Started run with seed {}".format(game_manager.seed))
+
+
+def rewind(game_manager, timestep, recorder):
+    global _rewind_warned
+    history = game_manager.history
+    if history is None:
+        if not _rewind_warned:
+            logging.info("Rewind needs per-tick save states, enable the array enemy store or "
+                         "savestate.HISTORY_WITHOUT_STORE")
+            _rewind_warned = True
+        return
     
+    if not len(history):
+        return
+    
+    game_manager.load_state(history.rewind(game_manager.config.savestate.REWIND_FRAMES))
+    recorder.rewind(game_manager.score)
+    timestep.reset()
+    logging.info("Rewound to score {}".format(game_manager.score))
+
+
+def resume_run(game_manager, timestep, recorder, filename):
+    game_manager.poll_assets(block=True)
     try:
-        game_manager = GameManager.get()
-        game_manager.state = "menu"
+        game_manager.load_state(load_state_file(filename))
+    except (IOError, ValueError, struct.error) as e:
+        logging.error("Failed to load game state '{}': {}".format(filename, e))
+        return False
+    
+    recorder.detach()
+    timestep.reset()
+    logging.info("Resumed run with seed {} at score {} from '{}'".format(
+        game_manager.seed, game_manager.score, filename))
+    return True
+
+
+def save_crash_state(game_manager):
+    if game_manager is None:
+        return
+    
+    filename = config.savestate.CRASH_STATE_FILE
+    try:
+        if game_manager.history is not None:
+            saved = game_manager.history.save(filename)
+        elif game_manager.state != "menu":
+            atomic_write(filename, game_manager.save_state())
+            saved = True
+        else:
+            saved = False
+    except Exception as e:
+        logging.error("Failed to save game state to '{}': {}".format(filename, e))
+        return
+    
+    if saved:
+        logging.error("Saved game state to '{}', resume with --resume {}".format(filename, filename))
+
+
+def save_crash_replay(recorder):
+    if recorder is None or not recorder.replayable or not len(recorder.recording):
+        return
+    
+    filename = config.replay.CRASH_REPLAY_FILE
+    try:
+        recorder.recording.save(filename)
+        logging.error("Saved replay of {} frames (seed {}) to '{}'".format(
+            len(recorder.recording), recorder.recording.seed, filename))
+    except IOError as e:
+        logging.error("Failed to save replay to '{}': {}".format(filename, e))
+
+
+def poll_startup(game_manager, renderer, startup):
+    if game_manager.poll_assets():
+        renderer.invalidate()
+    
+    if game_manager.assets_ready and not startup.reported:
+        startup.report()
+
+
+def run_sequential(game_manager, renderer, timestep, recorder, startup):
+    running = True
+    profiler = game_manager.profiler
+    while running:
+        elapsed = game_manager.clock.tick(config.timestep.RENDER_FPS) / 1000.0
+        profiler.begin_frame()
         
-        logging.info("Game started successfully")
+        profiler.start("events")
+        running = handle_events(game_manager, timestep, recorder)
+        profiler.stop("events")
+        
+        for _ in range(timestep.advance(elapsed)):
+            if game_manager.state != "game":
+                break
+            game_manager.update()
         
-        running = True
+        alpha = timestep.alpha if game_manager.state == "game" else 1.0
+        renderer.render(game_manager, alpha)
+        startup.mark("first_frame")
+        poll_startup(game_manager, renderer, startup)
+        profiler.end_frame()
+
+
+def run_pipelined(game_manager, renderer, timestep, recorder, startup):
+    simulation = SimulationThread(game_manager)
+    simulation.start()
+    logging.info("Running simulation and rendering on separate threads")
+    
+    running = True
+    profiler = game_manager.profiler
+    profiler.begin_frame()
+    try:
         while running:
-            running = handle_events(game_manager)
+            snapshot = simulation.wait()
+            profiler.end_frame()
             
-            if game_manager.state == "game":
-                game_manager.update()
+            elapsed = game_manager.clock.tick(config.timestep.RENDER_FPS) / 1000.0
+            profiler.begin_frame()
             
-            game_manager.screen.fill(config.display.BACKGROUND_COLOR)
-            game_manager.draw(game_manager.screen)
-            pygame.display.flip()
+            profiler.start("events")
+            running = handle_events(game_manager, timestep, recorder)
+            profiler.stop("events")
             
-            game_manager.clock.tick(config.fps)
+            alpha = timestep.alpha if snapshot.state == "game" else 1.0
+            simulation.submit(timestep.advance(elapsed))
+            renderer.render(game_manager, alpha, snapshot)
+            startup.mark("first_frame")
+            poll_startup(game_manager, renderer, startup)
+        
+        simulation.wait()
+        profiler.end_frame()
+    finally:
+        simulation.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play the survival game.")
+    parser.add_argument("--resume", default=None, help="Continue from a saved game state")
+    args = parser.parse_args(argv)
+    
+    startup = StartupProfiler()
+    with startup.phase("pygame"):
+        if not initialize_pygame():
+            return 1
+    
+    recorder = None
+    game_manager = None
+    
+    try:
+        with startup.phase("window"):
+            game_manager = GameManager(preload=False, game_config=config)
+        game_manager.load_assets(startup, background=True)
+        game_manager.state = "menu"
+        
+        recorder = InputRecorder(game_manager.input_source)
+        game_manager.input_source = recorder
+        renderer = create_renderer(game_manager.screen, config)
+        timestep = FixedTimestep(game_config=config)
+        
+        game_manager.history = create_history(config, game_manager.enemy_store is not None)
+        if args.resume:
+            resume_run(game_manager, timestep, recorder, args.resume)
+        
+        logging.info("Game started successfully")
+        
+        if config.pipeline.ENABLED:
+            run_pipelined(game_manager, renderer, timestep, recorder, startup)
+        else:
+            run_sequential(game_manager, renderer, timestep, recorder, startup)
         
+        logging.info("Asset cache: {}".format(AssetCache.get().get_stats()))
+        logging.info("Object pools: {}".format(game_manager.get_pool_stats()))
+        logging.info("Dropped {:.2f}s of simulation time to catch-up limit".format(timestep.dropped_time))
         logging.info("Game closed normally")
         return 0
     
     except Exception as e:
         logging.error("Unexpected error in main game loop: {}".format(e), exc_info=True)
+        save_crash_replay(recorder)
+        save_crash_state(game_manager)
         return 1
     
     finally:
+        if game_manager is not None:
+            game_manager.leaderboard.close()
+            game_manager.collision_handler.close()
         pygame.quit()
 
 
@@ -0,0 +1,42 @@
+class ObjectPool:
+    def __init__(self, factory, max_size):
+        self.factory = factory
+        self.max_size = max_size
+        self.free = []
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.discarded = 0
+    
+    def acquire(self, *args):
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args)
+            self.reused += 1
+            return obj
+        
+        self.created += 1
+        return self.factory(*args)
+    
+    def release(self, obj):
+        if len(self.free) >= self.max_size:
+            self.discarded += 1
+            return False
+        
+        self.free.append(obj)
+        self.released += 1
+        return True
+    
+    def release_all(self, objects):
+        for obj in objects:
+            self.release(obj)
+    
+    def get_stats(self):
+        return {
+            "free": len(self.free),
+            "capacity": self.max_size,
+            "in_use": self.created + self.reused - self.released - self.discarded,
+            "created": self.created,
+            "allocations_avoided": self.reused,
+            "discarded": self.discarded,
+        }
@@ -0,0 +1,284 @@
+import atexit
+import logging
+import multiprocessing
+from multiprocessing import resource_tracker, shared_memory
+from config import GameConfig
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+config = GameConfig()
+
+BOX_FIELDS = 4
+STRIP_MIN = -2 ** 31
+STRIP_MAX = 2 ** 31 - 1
+
+
+def create_parallel_broadphase(game_config=None):
+    game_config = game_config or config
+    if np is None:
+        logging.warning("NumPy is not installed, falling back to the grid broadphase")
+        return None
+    
+    return ParallelBroadphase(
+        game_config.collision.PARALLEL_WORKERS,
+        game_config.collision.PARALLEL_CAPACITY,
+        game_config.collision.PARALLEL_RESULT_CAPACITY,
+        game_config.collision.PARALLEL_START_METHOD
+    )
+
+
+def strip_pairs(boxes, count, top, bottom):
+    x = boxes[:count, 0]
+    y = boxes[:count, 1]
+    w = boxes[:count, 2]
+    h = boxes[:count, 3]
+    
+    inside = np.flatnonzero((y < bottom) & (y + h > top) & (w > 0) & (h > 0))
+    n = len(inside)
+    if n < 2:
+        return np.empty((0, 2), dtype=np.int32)
+    
+    order = inside[np.argsort(x[inside], kind="stable")]
+    xs = x[order]
+    ys = y[order]
+    ws = w[order]
+    hs = h[order]
+    max_width = ws.max()
+    
+    firsts = []
+    seconds = []
+    
+    for offset in range(1, n):
+        dx = xs[offset:] - xs[:-offset]
+        near = dx < max_width
+        if not near.any():
+            break
+        
+        ya = ys[:-offset]
+        yb = ys[offset:]
+        edge = np.maximum(ya, yb)
+        near &= (
+            (dx < ws[:-offset]) &
+            (ya < yb + hs[offset:]) & (yb < ya + hs[:-offset]) &
+            (edge >= top) & (edge < bottom)
+        )
+        if near.any():
+            a = order[:-offset][near]
+            b = order[offset:][near]
+            firsts.append(np.minimum(a, b))
+            seconds.append(np.maximum(a, b))
+    
+    if not firsts:
+        return np.empty((0, 2), dtype=np.int32)
+    
+    return np.stack((np.concatenate(firsts), np.concatenate(seconds)), axis=1).astype(np.int32)
+
+
+def _attach(name, shape):
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype=np.int32, buffer=block.buf)
+
+
+def _worker(conn):
+    boxes_block = results_block = None
+    boxes = results = None
+    
+    while True:
+        message = conn.recv()
+        command = message[0]
+        
+        if command == "detect":
+            _, count, top, bottom = message
+            pairs = strip_pairs(boxes, count, top, bottom)
+            if len(pairs) <= len(results):
+                results[:len(pairs)] = pairs
+            conn.send(len(pairs))
+        elif command == "boxes":
+            boxes = None
+            if boxes_block is not None:
+                boxes_block.close()
+            boxes_block, boxes = _attach(message[1], (message[2], BOX_FIELDS))
+            conn.send(True)
+        elif command == "results":
+            results = None
+            if results_block is not None:
+                results_block.close()
+            results_block, results = _attach(message[1], (message[2], 2))
+            conn.send(True)
+        else:
+            break
+    
+    boxes = results = None
+    for block in (boxes_block, results_block):
+        if block is not None:
+            block.close()
+    conn.close()
+
+
+class ParallelBroadphase:
+    def __init__(self, workers=None, capacity=None, result_capacity=None, start_method=None):
+        self.workers = max(1, workers or config.collision.PARALLEL_WORKERS)
+        self.start_method = start_method or config.collision.PARALLEL_START_METHOD
+        self.capacity = capacity or config.collision.PARALLEL_CAPACITY
+        self.result_capacity = result_capacity or config.collision.PARALLEL_RESULT_CAPACITY
+        self.processes = []
+        self.connections = []
+        self.boxes_block = None
+        self.boxes = None
+        self.results_blocks = []
+        self.results = []
+        self.frames = 0
+        self.retries = 0
+        atexit.register(self.close)
+    
+    def start(self):
+        if self.processes:
+            return
+        
+        resource_tracker.ensure_running()
+        context = multiprocessing.get_context(self.start_method)
+        for index in range(self.workers):
+            parent, child = context.Pipe()
+            process = context.Process(
+                target=_worker, args=(child,), name="collision-worker-{}".format(index), daemon=True)
+            process.start()
+            child.close()
+            self.processes.append(process)
+            self.connections.append(parent)
+        
+        self._allocate_boxes(self.capacity)
+        self._allocate_results(self.result_capacity)
+        logging.info("Started {} collision workers".format(self.workers))
+    
+    def _broadcast(self, messages):
+        for conn, message in zip(self.connections, messages):
+            conn.send(message)
+        return [conn.recv() for conn in self.connections]
+    
+    def _allocate_boxes(self, capacity):
+        old_block = self.boxes_block
+        self.boxes = None
+        self.boxes_block = shared_memory.SharedMemory(create=True, size=capacity * BOX_FIELDS * 4)
+        self.boxes = np.ndarray((capacity, BOX_FIELDS), dtype=np.int32, buffer=self.boxes_block.buf)
+        self.capacity = capacity
+        
+        self._broadcast([("boxes", self.boxes_block.name, capacity)] * self.workers)
+        if old_block is not None:
+            old_block.close()
+            old_block.unlink()
+    
+    def _allocate_results(self, capacity):
+        old_blocks = self.results_blocks
+        self.results = []
+        self.results_blocks = [
+            shared_memory.SharedMemory(create=True, size=capacity * 2 * 4)
+            for _ in range(self.workers)
+        ]
+        self.results = [
+            np.ndarray((capacity, 2), dtype=np.int32, buffer=block.buf)
+            for block in self.results_blocks
+        ]
+        self.result_capacity = capacity
+        
+        self._broadcast([("results", block.name, capacity) for block in self.results_blocks])
+        for block in old_blocks:
+            block.close()
+            block.unlink()
+    
+    def _reserve(self, count):
+        self.start()
+        if count > self.capacity:
+            capacity = self.capacity
+            while capacity < count:
+                capacity *= 2
+            self._allocate_boxes(capacity)
+    
+    def colliding_pairs(self, rects):
+        count = len(rects)
+        if count < 2:
+            return []
+        
+        self._reserve(count)
+        self.boxes[:count] = [(rect.x, rect.y, rect.width, rect.height) for rect in rects]
+        return self._detect(count)
+    
+    def colliding_pairs_arrays(self, x, y, size):
+        count = len(x)
+        if count < 2:
+            return []
+        
+        self._reserve(count)
+        boxes = self.boxes
+        boxes[:count, 0] = x
+        boxes[:count, 1] = y
+        boxes[:count, 2] = size
+        boxes[:count, 3] = size
+        return self._detect(count)
+    
+    def _strips(self, count):
+        cuts = np.percentile(self.boxes[:count, 1], np.linspace(0, 100, self.workers + 1)[1:-1])
+        edges = [STRIP_MIN] + [int(cut) for cut in cuts] + [STRIP_MAX]
+        return [(edges[i], max(edges[i], edges[i + 1])) for i in range(self.workers)]
+    
+    def _detect(self, count):
+        self.frames += 1
+        strips = self._strips(count)
+        counts = self._broadcast([("detect", count, top, bottom) for top, bottom in strips])
+        
+        largest = max(counts)
+        if largest > self.result_capacity:
+            self.retries += 1
+            capacity = self.result_capacity
+            while capacity < largest:
+                capacity *= 2
+            self._allocate_results(capacity)
+            counts = self._broadcast([("detect", count, top, bottom) for top, bottom in strips])
+        
+        pairs = np.concatenate([
+            results[:pair_count] for results, pair_count in zip(self.results, counts)
+        ])
+        if not len(pairs):
+            return []
+        
+        ordering = np.lexsort((pairs[:, 1], pairs[:, 0]))
+        pairs = pairs[ordering]
+        return list(zip(pairs[:, 0].tolist(), pairs[:, 1].tolist()))
+    
+    def get_stats(self):
+        return {
+            "workers": self.workers,
+            "capacity": self.capacity,
+            "result_capacity": self.result_capacity,
+            "frames": self.frames,
+            "retries": self.retries,
+        }
+    
+    def close(self):
+        if not self.processes:
+            return
+        
+        for conn in self.connections:
+            try:
+                conn.send(("stop",))
+            except (OSError, EOFError):
+                pass
+        for process in self.processes:
+            process.join(timeout=1.0)
+            if process.is_alive():
+                process.terminate()
+        for conn in self.connections:
+            conn.close()
+        
+        self.boxes = None
+        self.results = []
+        for block in [self.boxes_block] + self.results_blocks:
+            if block is not None:
+                block.close()
+                block.unlink()
+        self.boxes_block = None
+        self.results_blocks = []
+        self.processes = []
+        self.connections = []
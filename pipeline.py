@@ -0,0 +1,69 @@
+import threading
+
+
+class SimulationThread(threading.Thread):
+    def __init__(self, game_manager):
+        super().__init__(name="simulation", daemon=True)
+        self.game_manager = game_manager
+        self.condition = threading.Condition()
+        self.pending_steps = None
+        self.busy = False
+        self.stopping = False
+        self.error = None
+        self.front = game_manager.capture_snapshot()
+        self.back = None
+    
+    def submit(self, steps):
+        with self.condition:
+            self.pending_steps = steps
+            self.busy = True
+            self.condition.notify_all()
+    
+    def wait(self):
+        with self.condition:
+            while self.busy:
+                self.condition.wait()
+            
+            if self.error is not None:
+                raise self.error
+            
+            if self.back is not None:
+                self.front, self.back = self.back, None
+            return self.front
+    
+    def stop(self):
+        with self.condition:
+            self.stopping = True
+            self.condition.notify_all()
+        self.join()
+    
+    def run(self):
+        while True:
+            with self.condition:
+                while self.pending_steps is None and not self.stopping:
+                    self.condition.wait()
+                if self.stopping:
+                    return
+                steps = self.pending_steps
+                self.pending_steps = None
+            
+            snapshot = None
+            error = None
+            try:
+                snapshot = self._simulate(steps)
+            except Exception as e:
+                error = e
+            
+            with self.condition:
+                self.back = snapshot
+                self.error = error
+                self.busy = False
+                self.condition.notify_all()
+    
+    def _simulate(self, steps):
+        game_manager = self.game_manager
+        for _ in range(steps):
+            if game_manager.state != "game":
+                break
+            game_manager.update()
+        return game_manager.capture_snapshot()
@@ -0,0 +1,193 @@
+import json
+import logging
+import time
+import pygame
+from config import GameConfig
+
+config = GameConfig()
+
+PHASES = ("events", "spawning", "entities", "collisions", "powerups", "draw", "flip")
+
+HISTOGRAM_BUCKETS = [0.00001 * (1.25 ** i) for i in range(50)]
+
+
+class PhaseHistogram:
+    def __init__(self):
+        self.counts = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+        self.total = 0
+    
+    def add(self, duration):
+        low = 0
+        high = len(HISTOGRAM_BUCKETS)
+        while low < high:
+            middle = (low + high) // 2
+            if duration <= HISTOGRAM_BUCKETS[middle]:
+                high = middle
+            else:
+                low = middle + 1
+        self.counts[low] += 1
+        self.total += 1
+    
+    def percentile(self, fraction):
+        if self.total == 0:
+            return 0.0
+        
+        target = fraction * self.total
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                if index < len(HISTOGRAM_BUCKETS):
+                    return HISTOGRAM_BUCKETS[index]
+                return HISTOGRAM_BUCKETS[-1]
+        return HISTOGRAM_BUCKETS[-1]
+
+
+class FrameProfiler:
+    def __init__(self, enabled=None, history_frames=None, game_config=None):
+        self.config = game_config or config
+        self.enabled = self.config.profiler.ENABLED if enabled is None else enabled
+        self.overlay_visible = False
+        self.capacity = history_frames or self.config.profiler.HISTORY_FRAMES
+        self.phases = PHASES + ("frame",)
+        
+        self.frame_starts = [0.0] * self.capacity
+        self.starts = dict((phase, [0.0] * self.capacity) for phase in self.phases)
+        self.durations = dict((phase, [0.0] * self.capacity) for phase in self.phases)
+        self.histograms = dict((phase, PhaseHistogram()) for phase in self.phases)
+        self.slot = 0
+        self.frames = 0
+        
+        self._frame_start = 0.0
+        self._open = {}
+        self._overlay_surface = None
+        self._overlay_font = None
+    
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+        if self.overlay_visible:
+            self.enabled = True
+        self._overlay_surface = None
+    
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        
+        self._frame_start = time.perf_counter()
+        slot = self.slot
+        self.frame_starts[slot] = self._frame_start
+        for phase in PHASES:
+            self.durations[phase][slot] = 0.0
+    
+    def start(self, phase):
+        if not self.enabled:
+            return
+        self._open[phase] = time.perf_counter()
+    
+    def stop(self, phase):
+        if not self.enabled:
+            return
+        
+        started = self._open.pop(phase, None)
+        if started is None:
+            return
+        
+        slot = self.slot
+        if not self.durations[phase][slot]:
+            self.starts[phase][slot] = started - self._frame_start
+        self.durations[phase][slot] += time.perf_counter() - started
+    
+    def end_frame(self):
+        if not self.enabled:
+            return
+        
+        slot = self.slot
+        self.starts["frame"][slot] = 0.0
+        self.durations["frame"][slot] = time.perf_counter() - self._frame_start
+        
+        for phase in self.phases:
+            duration = self.durations[phase][slot]
+            if duration:
+                self.histograms[phase].add(duration)
+        
+        self.slot = (slot + 1) % self.capacity
+        self.frames += 1
+    
+    def get_percentiles(self, phase):
+        histogram = self.histograms[phase]
+        return {
+            "p50": histogram.percentile(0.50),
+            "p95": histogram.percentile(0.95),
+            "p99": histogram.percentile(0.99),
+            "samples": histogram.total,
+        }
+    
+    def get_summary(self):
+        return dict((phase, self.get_percentiles(phase)) for phase in self.phases)
+    
+    def _recorded_slots(self):
+        count = min(self.frames, self.capacity)
+        first = (self.slot - count) % self.capacity
+        return [(first + offset) % self.capacity for offset in range(count)]
+    
+    def export_chrome_trace(self, filename=None):
+        filename = filename or self.config.profiler.TRACE_FILE
+        events = []
+        
+        for slot in self._recorded_slots():
+            frame_start = self.frame_starts[slot]
+            for phase in self.phases:
+                duration = self.durations[phase][slot]
+                if not duration:
+                    continue
+                events.append({
+                    "name": phase,
+                    "cat": "frame" if phase == "frame" else "phase",
+                    "ph": "X",
+                    "ts": (frame_start + self.starts[phase][slot]) * 1000000.0,
+                    "dur": duration * 1000000.0,
+                    "pid": 1,
+                    "tid": 1,
+                })
+        
+        try:
+            with open(filename, 'w') as f:
+                json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+            logging.info("Exported {} trace events to '{}'".format(len(events), filename))
+            return True
+        except IOError as e:
+            logging.error("Failed to export trace to '{}': {}".format(filename, e))
+            return False
+    
+    def draw_overlay(self, surface):
+        if not self.overlay_visible:
+            return []
+        
+        if self._overlay_font is None:
+            self._overlay_font = pygame.font.Font(None, self.config.profiler.OVERLAY_FONT_SIZE)
+        
+        if self._overlay_surface is None or self.frames % self.config.profiler.OVERLAY_REFRESH_FRAMES == 0:
+            self._overlay_surface = self._render_overlay(self._overlay_font)
+        
+        margin = self.config.ui.SCORE_MARGIN
+        rect = self._overlay_surface.get_rect(bottomleft=(margin, self.config.height - margin))
+        return [surface.blit(self._overlay_surface, rect)]
+    
+    def _render_overlay(self, font):
+        lines = []
+        for phase in self.phases:
+            stats = self.get_percentiles(phase)
+            lines.append("{:<10} p50 {:6.2f}  p95 {:6.2f}  p99 {:6.2f} ms".format(
+                phase, stats["p50"] * 1000, stats["p95"] * 1000, stats["p99"] * 1000))
+        
+        rendered = [font.render(line, True, self.config.ui.COLOR_TEXT) for line in lines]
+        width = max(line.get_width() for line in rendered)
+        height = sum(line.get_height() for line in rendered)
+        
+        overlay = pygame.Surface((width, height))
+        overlay.fill(self.config.display.BACKGROUND_COLOR)
+        y = 0
+        for line in rendered:
+            overlay.blit(line, (0, y))
+            y += line.get_height()
+        return overlay
@@ -0,0 +1,116 @@
+import pygame
+from config import GameConfig
+
+config = GameConfig()
+
+
+def draw_frame(game_manager, surface, alpha, snapshot):
+    if snapshot is None:
+        return game_manager.draw(surface, alpha)
+    return game_manager.draw_snapshot(surface, snapshot, alpha)
+
+
+class FullFrameRenderer:
+    def __init__(self, screen, game_config=None):
+        self.screen = screen
+        self.background = (game_config or config).display.BACKGROUND_COLOR
+    
+    def invalidate(self):
+        pass
+    
+    def render(self, game_manager, alpha=1.0, snapshot=None):
+        profiler = game_manager.profiler
+        
+        profiler.start("draw")
+        self.screen.fill(self.background)
+        draw_frame(game_manager, self.screen, alpha, snapshot)
+        profiler.stop("draw")
+        
+        profiler.start("flip")
+        pygame.display.flip()
+        profiler.stop("flip")
+
+
+class DirtyRectRenderer:
+    def __init__(self, screen, max_dirty_ratio=None, game_config=None):
+        game_config = game_config or config
+        self.screen = screen
+        self.background = game_config.display.BACKGROUND_COLOR
+        self.max_dirty_area = int(
+            game_config.width * game_config.height *
+            (max_dirty_ratio if max_dirty_ratio is not None else game_config.display.DIRTY_RECT_MAX_RATIO)
+        )
+        self.previous_rects = []
+        self.last_state = None
+        self.full_frames = 0
+        self.dirty_frames = 0
+        self.skipped_frames = 0
+    
+    def invalidate(self):
+        self.last_state = None
+    
+    def render(self, game_manager, alpha=1.0, snapshot=None):
+        state = game_manager.state if snapshot is None else snapshot.state
+        
+        if state != self.last_state:
+            self._render_full(game_manager, alpha, snapshot)
+            self.last_state = state
+            return
+        
+        if state != "game":
+            self.skipped_frames += 1
+            return
+        
+        profiler = game_manager.profiler
+        profiler.start("draw")
+        
+        background = self.background
+        for rect in self.previous_rects:
+            self.screen.fill(background, rect)
+        
+        rects = draw_frame(game_manager, self.screen, alpha, snapshot)
+        dirty = self.previous_rects + rects
+        self.previous_rects = rects
+        
+        dirty_area = 0
+        for rect in dirty:
+            dirty_area += rect.width * rect.height
+        
+        profiler.stop("draw")
+        profiler.start("flip")
+        
+        if dirty_area > self.max_dirty_area:
+            pygame.display.flip()
+            self.full_frames += 1
+        else:
+            pygame.display.update(dirty)
+            self.dirty_frames += 1
+        
+        profiler.stop("flip")
+    
+    def _render_full(self, game_manager, alpha=1.0, snapshot=None):
+        profiler = game_manager.profiler
+        
+        profiler.start("draw")
+        self.screen.fill(self.background)
+        self.previous_rects = draw_frame(game_manager, self.screen, alpha, snapshot)
+        profiler.stop("draw")
+        
+        profiler.start("flip")
+        pygame.display.flip()
+        profiler.stop("flip")
+        self.full_frames += 1
+    
+    def get_stats(self):
+        return {
+            "full_frames": self.full_frames,
+            "dirty_frames": self.dirty_frames,
+            "skipped_frames": self.skipped_frames,
+        }
+
+
+def create_renderer(screen, game_config=None):
+    game_config = game_config or config
+    if game_config.display.USE_DIRTY_RECTS:
+        return DirtyRectRenderer(screen, game_config=game_config)
+    return FullFrameRenderer(screen, game_config)
@@ -0,0 +1,187 @@
+import argparse
+import logging
+import struct
+import sys
+import time
+from simulation import HeadlessSimulation
+
+REPLAY_MAGIC = b"PGRP"
+REPLAY_VERSION = 1
+HEADER_FORMAT = "<4sHIII"
+RUN_FORMAT = "<BH"
+MAX_RUN_LENGTH = 0xFFFF
+
+
+def encode_move(move_x, move_y):
+    return (move_x + 1) * 3 + (move_y + 1)
+
+
+def decode_move(code):
+    return code // 3 - 1, code % 3 - 1
+
+
+class Recording:
+    def __init__(self, seed, codes=None):
+        self.seed = seed
+        self.codes = bytearray(codes or b"")
+    
+    def __len__(self):
+        return len(self.codes)
+    
+    def _runs(self):
+        runs = []
+        for code in self.codes:
+            if runs and runs[-1][0] == code and runs[-1][1] < MAX_RUN_LENGTH:
+                runs[-1][1] += 1
+            else:
+                runs.append([code, 1])
+        return runs
+    
+    def to_bytes(self):
+        runs = self._runs()
+        header = struct.pack(HEADER_FORMAT, REPLAY_MAGIC, REPLAY_VERSION, self.seed, len(self.codes), len(runs))
+        return header + b"".join(struct.pack(RUN_FORMAT, code, length) for code, length in runs)
+    
+    @classmethod
+    def from_bytes(cls, data):
+        header_size = struct.calcsize(HEADER_FORMAT)
+        run_size = struct.calcsize(RUN_FORMAT)
+        
+        magic, version, seed, frame_count, run_count = struct.unpack_from(HEADER_FORMAT, data)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError("Not a replay file or unsupported version")
+        
+        codes = bytearray()
+        for index in range(run_count):
+            code, length = struct.unpack_from(RUN_FORMAT, data, header_size + index * run_size)
+            codes.extend(bytes((code,)) * length)
+        
+        if len(codes) != frame_count:
+            raise ValueError("Replay is truncated: expected {} frames, found {}".format(frame_count, len(codes)))
+        return cls(seed, codes)
+    
+    def save(self, filename):
+        with open(filename, "wb") as f:
+            f.write(self.to_bytes())
+    
+    @classmethod
+    def load(cls, filename):
+        with open(filename, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class InputRecorder:
+    def __init__(self, source):
+        self.source = source
+        self.recording = Recording(0)
+        self.replayable = True
+    
+    def reset(self, game_manager):
+        self.recording = Recording(game_manager.seed)
+        self.replayable = True
+        self.source.reset(game_manager)
+    
+    def rewind(self, frames):
+        del self.recording.codes[frames:]
+    
+    def detach(self):
+        self.replayable = False
+    
+    def get_movement(self, game_manager):
+        move_x, move_y = self.source.get_movement(game_manager)
+        self.recording.codes.append(encode_move(move_x, move_y))
+        return move_x, move_y
+
+
+class ReplayInput:
+    def __init__(self, recording):
+        self.recording = recording
+        self.frame = 0
+    
+    def reset(self, game_manager):
+        self.frame = 0
+    
+    def get_movement(self, game_manager):
+        codes = self.recording.codes
+        if self.frame >= len(codes):
+            return 0, 0
+        
+        code = codes[self.frame]
+        self.frame += 1
+        return decode_move(code)
+
+
+class ReplayPlayer:
+    def __init__(self, recording, game_config=None):
+        self.recording = recording
+        self.simulation = HeadlessSimulation(ReplayInput(recording), game_config=game_config)
+        self.game_manager = self.simulation.game_manager
+        self.restart()
+    
+    @property
+    def frame(self):
+        return self.simulation.frame
+    
+    def restart(self):
+        self.simulation.reset(self.recording.seed)
+    
+    def seek(self, frame):
+        frame = min(frame, len(self.recording))
+        if frame < self.simulation.frame:
+            self.restart()
+        
+        while self.simulation.frame < frame:
+            if not self.simulation.step():
+                break
+        return self.simulation.frame
+    
+    def play(self, speed=None):
+        frame_time = 1.0 / (self.game_manager.config.fps * speed) if speed else 0.0
+        next_frame = time.perf_counter()
+        
+        while self.simulation.frame < len(self.recording):
+            if not self.simulation.step():
+                break
+            
+            if frame_time:
+                next_frame += frame_time
+                delay = next_frame - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+        return self.simulation.frame
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Re-simulate a recorded run without rendering.")
+    parser.add_argument("replay")
+    parser.add_argument("--frame", type=int, default=None, help="Stop at this frame instead of the end")
+    parser.add_argument("--speed", type=float, default=None, help="Pace playback at this multiple of realtime")
+    args = parser.parse_args(argv)
+    
+    try:
+        recording = Recording.load(args.replay)
+    except (IOError, ValueError, struct.error) as e:
+        logging.error("Failed to load replay '{}': {}".format(args.replay, e))
+        return 1
+    
+    player = ReplayPlayer(recording)
+    start = time.perf_counter()
+    if args.frame is not None:
+        player.seek(args.frame)
+    else:
+        player.play(args.speed)
+    elapsed = time.perf_counter() - start
+    
+    game_manager = player.game_manager
+    logging.info("Seed {}: frame {}/{}, state {}, score {}, difficulty {:.2f}, enemies {} ({:.3f}s)".format(
+        recording.seed, player.frame, len(recording), game_manager.state, game_manager.score,
+        game_manager.difficulty, game_manager.get_enemy_count(), elapsed))
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+    sys.exit(main())
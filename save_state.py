@@ -0,0 +1,240 @@
+import logging
+import random
+import struct
+from array import array
+from collections import deque
+from enemy_store import STATE_FIELDS
+from entities import Player
+from leaderboard import atomic_write
+from config import GameConfig
+
+config = GameConfig()
+
+SAVE_MAGIC = b"PGSS"
+SAVE_VERSION = 2
+STATES = ("menu", "game", "gameover")
+
+HEADER = struct.Struct("<4sHBBIII")
+GAME = struct.Struct("<qIIIdIIIII")
+PLAYER = struct.Struct("<BiiiiiId")
+RNG = struct.Struct("<I625IBd")
+ENEMY_TYPECODES = "iiiiiiiBiiB"
+ENEMY_FIELDS = len(STATE_FIELDS)
+POWERUP = struct.Struct("<iiB")
+KILL = struct.Struct("<BI")
+
+
+def _pack_rng(rng):
+    version, internal, gauss_next = rng.getstate()
+    return RNG.pack(version, *internal, gauss_next is not None, gauss_next or 0.0)
+
+
+def _unpack_rng(data, offset):
+    values = RNG.unpack_from(data, offset)
+    gauss_next = values[-1] if values[-2] else None
+    return (values[0], tuple(values[1:-2]), gauss_next)
+
+
+def encode_state(game_manager):
+    archetypes = game_manager.archetypes
+    enemy_store = game_manager.enemy_store
+    player = game_manager.get_player()
+    tracking = game_manager.tracking
+    powerup_types = tuple(game_manager.config.powerup.COLORS)
+    
+    if enemy_store is not None:
+        n = enemy_store.count
+        enemies = enemy_store.save_state()
+    else:
+        n = len(game_manager.registry.enemies)
+        values = []
+        for enemy in game_manager.registry.enemies:
+            rect = enemy.rect
+            values += (
+                rect.x, rect.y, enemy.prev_x, enemy.prev_y, enemy.vx, enemy.vy,
+                enemy.speed, enemy.type_id, enemy.confused, enemy.phase, enemy.needs_target
+            )
+        enemies = b"".join(
+            array(typecode, values[field::ENEMY_FIELDS]).tobytes()
+            for field, typecode in enumerate(ENEMY_TYPECODES)
+        )
+    
+    if player is not None:
+        player_data = PLAYER.pack(
+            1, player.rect.x, player.rect.y, player.prev_x, player.prev_y,
+            player.health, player.damage_cooldown, player.stamina)
+    else:
+        player_data = PLAYER.pack(0, 0, 0, 0, 0, 0, 0, 0.0)
+    
+    parts = [
+        HEADER.pack(
+            SAVE_MAGIC, SAVE_VERSION, STATES.index(game_manager.state), enemy_store is not None,
+            n, len(game_manager.powerups), len(game_manager.kills)),
+        GAME.pack(
+            -1 if game_manager.seed is None else game_manager.seed,
+            game_manager.score,
+            game_manager.spawn_timer,
+            game_manager.powerup_spawn_timer,
+            game_manager.difficulty,
+            game_manager.red_powerup_timer,
+            game_manager.blue_powerup_timer,
+            game_manager.yellow_powerup_timer,
+            tracking.tick,
+            tracking.spawned),
+        _pack_rng(game_manager.rng),
+        player_data,
+        enemies,
+    ]
+    parts.extend(
+        POWERUP.pack(powerup.rect.x, powerup.rect.y, powerup_types.index(powerup.powerup_type))
+        for powerup in game_manager.powerups
+    )
+    parts.extend(
+        KILL.pack(archetypes.type_id_for_color(color), count)
+        for color, count in game_manager.kills.items()
+    )
+    return b"".join(parts)
+
+
+def decode_state(game_manager, data):
+    magic, version, state, _, enemy_count, powerup_count, kill_count = HEADER.unpack_from(data)
+    if magic != SAVE_MAGIC or version != SAVE_VERSION:
+        raise ValueError("Not a save state or unsupported version")
+    offset = HEADER.size
+    
+    (seed, score, spawn_timer, powerup_spawn_timer, difficulty,
+     red_timer, blue_timer, yellow_timer, tick, spawned) = GAME.unpack_from(data, offset)
+    offset += GAME.size
+    
+    rng_state = _unpack_rng(data, offset)
+    offset += RNG.size
+    
+    has_player, px, py, prev_px, prev_py, health, damage_cooldown, stamina = PLAYER.unpack_from(data, offset)
+    offset += PLAYER.size
+    
+    game_manager.enemy_pool.release_all(game_manager.registry.enemies)
+    game_manager.powerup_pool.release_all(game_manager.powerups)
+    game_manager.registry.clear()
+    game_manager.powerups = []
+    
+    game_manager.state = STATES[state]
+    game_manager.seed = None if seed < 0 else seed
+    game_manager.score = score
+    game_manager.spawn_timer = spawn_timer
+    game_manager.powerup_spawn_timer = powerup_spawn_timer
+    game_manager.difficulty = difficulty
+    game_manager.red_powerup_timer = red_timer
+    game_manager.blue_powerup_timer = blue_timer
+    game_manager.yellow_powerup_timer = yellow_timer
+    game_manager.rng.setstate(rng_state)
+    
+    tracking = game_manager.tracking
+    tracking.reset()
+    tracking.tick = tick
+    tracking.spawned = spawned
+    
+    if has_player:
+        player = Player(px, py, game_manager.config)
+        player.prev_x = prev_px
+        player.prev_y = prev_py
+        player.health = health
+        player.damage_cooldown = damage_cooldown
+        player.stamina = stamina
+        game_manager.add_entity(player)
+    
+    offset = _decode_enemies(game_manager, data, offset, enemy_count)
+    
+    powerup_types = tuple(game_manager.config.powerup.COLORS)
+    for _ in range(powerup_count):
+        x, y, powerup_type = POWERUP.unpack_from(data, offset)
+        offset += POWERUP.size
+        game_manager.powerups.append(game_manager.powerup_pool.acquire(x, y, powerup_types[powerup_type]))
+    
+    colors = game_manager.archetypes.colors
+    kills = {}
+    for _ in range(kill_count):
+        type_id, count = KILL.unpack_from(data, offset)
+        offset += KILL.size
+        kills[colors[type_id]] = count
+    game_manager.kills = kills
+
+
+def _decode_enemies(game_manager, data, offset, count):
+    enemy_store = game_manager.enemy_store
+    if enemy_store is not None:
+        return enemy_store.load_state(data, offset, count)
+    
+    columns = []
+    for typecode in ENEMY_TYPECODES:
+        column = array(typecode)
+        end = offset + count * column.itemsize
+        column.frombytes(data[offset:end])
+        columns.append(column)
+        offset = end
+    
+    archetypes = game_manager.archetypes
+    restore_rng = random.Random(0)
+    
+    for x, y, prev_x, prev_y, vx, vy, speed, type_id, confused, phase, needs_target in zip(*columns):
+        enemy = game_manager.enemy_pool.acquire(x, y, archetypes[type_id], restore_rng, phase)
+        enemy.prev_x = prev_x
+        enemy.prev_y = prev_y
+        enemy.vx = vx
+        enemy.vy = vy
+        enemy.speed = speed
+        enemy.confused = confused
+        enemy.needs_target = bool(needs_target)
+        game_manager.add_entity(enemy)
+    
+    return offset
+
+
+def create_history(game_config=None, store_mode=False):
+    game_config = game_config or config
+    if not game_config.savestate.HISTORY_FRAMES:
+        return None
+    
+    if not store_mode and not game_config.savestate.HISTORY_WITHOUT_STORE:
+        logging.info("Per-tick save states need the array enemy store, rewind is disabled")
+        return None
+    
+    return SaveStateHistory(game_config.savestate.HISTORY_FRAMES)
+
+
+class SaveStateHistory:
+    def __init__(self, capacity=None):
+        self.capacity = capacity or config.savestate.HISTORY_FRAMES
+        self.states = deque(maxlen=self.capacity)
+    
+    def __len__(self):
+        return len(self.states)
+    
+    def clear(self):
+        self.states.clear()
+    
+    def push(self, data):
+        self.states.append(data)
+    
+    def latest(self):
+        return self.states[-1] if self.states else None
+    
+    def rewind(self, frames):
+        if not self.states:
+            return None
+        
+        for _ in range(min(frames, len(self.states) - 1)):
+            self.states.pop()
+        return self.states[-1]
+    
+    def save(self, filename):
+        data = self.latest()
+        if data is None:
+            return False
+        
+        atomic_write(filename, data)
+        return True
+
+
+def load_state_file(filename):
+    with open(filename, "rb") as f:
+        return f.read()
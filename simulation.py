@@ -0,0 +1,82 @@
+import argparse
+import logging
+import sys
+import time
+from game_manager import GameManager
+from input_source import NullInput
+
+
+class HeadlessSimulation:
+    def __init__(self, input_source=None, seed=None, game_config=None):
+        self.game_manager = GameManager(
+            headless=True, input_source=input_source or NullInput(), seed=seed, game_config=game_config)
+        self.frame = 0
+    
+    def reset(self, seed=None):
+        self.game_manager.reset_game(seed)
+        self.game_manager.state = "game"
+        self.frame = 0
+    
+    def save_state(self):
+        return self.game_manager.save_state()
+    
+    def load_state(self, data):
+        self.game_manager.load_state(data)
+        self.frame = self.game_manager.score
+    
+    @classmethod
+    def fork(cls, data, input_source=None, game_config=None):
+        simulation = cls(input_source, game_config=game_config)
+        simulation.load_state(data)
+        return simulation
+    
+    def step(self):
+        profiler = self.game_manager.profiler
+        profiler.begin_frame()
+        self.game_manager.update()
+        profiler.end_frame()
+        self.frame += 1
+        return self.game_manager.state == "game"
+    
+    def run(self, max_frames=None, seed=None):
+        self.reset(seed)
+        while max_frames is None or self.frame < max_frames:
+            if not self.step():
+                break
+        return self.frame
+    
+    def survival_seconds(self):
+        return self.frame / float(self.game_manager.config.fps)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the game logic headless as fast as possible.")
+    parser.add_argument("--games", type=int, default=1)
+    parser.add_argument("--max-frames", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+    
+    simulation = HeadlessSimulation(seed=args.seed)
+    total_frames = 0
+    start = time.perf_counter()
+    
+    for game in range(args.games):
+        frames = simulation.run(args.max_frames)
+        total_frames += frames
+        logging.info("Game {} (seed {}): {} frames, score {}, difficulty {:.2f}".format(
+            game, simulation.game_manager.seed, frames, simulation.game_manager.score,
+            simulation.game_manager.difficulty))
+    
+    elapsed = time.perf_counter() - start
+    if elapsed > 0:
+        logging.info("Simulated {} frames in {:.2f}s ({:.0f} frames/s)".format(
+            total_frames, elapsed, total_frames / elapsed))
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+    sys.exit(main())
@@ -0,0 +1,22 @@
+class FrameSnapshot:
+    __slots__ = ("state", "sprites", "enemies", "powerups", "hud", "high_score")
+    
+    def __init__(self, state, sprites, enemies, powerups, hud, high_score):
+        self.state = state
+        self.sprites = sprites
+        self.enemies = enemies
+        self.powerups = powerups
+        self.hud = hud
+        self.high_score = high_score
+
+
+class HudState:
+    __slots__ = ("health_ratio", "stamina_ratio", "score", "red_timer", "blue_timer", "yellow_timer")
+    
+    def __init__(self, health_ratio, stamina_ratio, score, red_timer, blue_timer, yellow_timer):
+        self.health_ratio = health_ratio
+        self.stamina_ratio = stamina_ratio
+        self.score = score
+        self.red_timer = red_timer
+        self.blue_timer = blue_timer
+        self.yellow_timer = yellow_timer
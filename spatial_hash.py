@@ -0,0 +1,74 @@
+from config import GameConfig
+
+config = GameConfig()
+
+
+class SpatialHash:
+    def __init__(self, width=None, height=None, cell_size=None):
+        self.width = width if width is not None else config.width
+        self.height = height if height is not None else config.height
+        self.cell_size = cell_size if cell_size is not None else config.collision.BROADPHASE_CELL_SIZE
+        
+        self.cols = max(1, -(-self.width // self.cell_size))
+        self.rows = max(1, -(-self.height // self.cell_size))
+        self.cells = [[] for _ in range(self.cols * self.rows)]
+        self.used_cells = []
+    
+    def clear(self):
+        for cell_index in self.used_cells:
+            self.cells[cell_index] = []
+        self.used_cells = []
+    
+    def _cell_range(self, low, high, limit):
+        first = low // self.cell_size
+        last = (high - 1) // self.cell_size
+        
+        if first < 0:
+            first = 0
+        elif first >= limit:
+            first = limit - 1
+        
+        if last < first:
+            last = first
+        elif last >= limit:
+            last = limit - 1
+        
+        return first, last
+    
+    def insert(self, index, rect):
+        col_first, col_last = self._cell_range(rect.left, rect.right, self.cols)
+        row_first, row_last = self._cell_range(rect.top, rect.bottom, self.rows)
+        
+        for row in range(row_first, row_last + 1):
+            base = row * self.cols
+            for col in range(col_first, col_last + 1):
+                cell_index = base + col
+                cell = self.cells[cell_index]
+                if not cell:
+                    self.used_cells.append(cell_index)
+                cell.append(index)
+    
+    def build(self, rects):
+        self.clear()
+        for index, rect in enumerate(rects):
+            self.insert(index, rect)
+    
+    def candidate_pairs(self):
+        pairs = set()
+        
+        for cell_index in self.used_cells:
+            cell = self.cells[cell_index]
+            count = len(cell)
+            for i in range(count - 1):
+                first = cell[i]
+                for j in range(i + 1, count):
+                    pairs.add((first, cell[j]))
+        
+        return sorted(pairs)
+    
+    def colliding_pairs(self, rects):
+        self.build(rects)
+        return [
+            (i, j) for i, j in self.candidate_pairs()
+            if rects[i].colliderect(rects[j])
+        ]
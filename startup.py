@@ -0,0 +1,124 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+import pygame
+from asset_cache import AssetCache
+from audio_manager import AudioManager
+from leaderboard import Leaderboard
+from config import GameConfig
+
+config = GameConfig()
+
+
+class StartupProfiler:
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.lock = threading.Lock()
+        self.phases = []
+        self.marks = {}
+        self.reported = False
+    
+    @contextmanager
+    def phase(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            finished = time.perf_counter()
+            with self.lock:
+                self.phases.append((name, started - self.origin, finished - started, threading.current_thread().name))
+    
+    def mark(self, name):
+        with self.lock:
+            if name not in self.marks:
+                self.marks[name] = time.perf_counter() - self.origin
+    
+    def get_mark_ms(self, name):
+        with self.lock:
+            elapsed = self.marks.get(name)
+        return None if elapsed is None else elapsed * 1000.0
+    
+    def within_budget(self, budget_ms=None):
+        budget_ms = config.startup.FIRST_FRAME_BUDGET_MS if budget_ms is None else budget_ms
+        first_frame = self.get_mark_ms("first_frame")
+        return first_frame is not None and first_frame <= budget_ms
+    
+    def report(self):
+        self.reported = True
+        with self.lock:
+            phases = sorted(self.phases, key=lambda phase: phase[1])
+            marks = sorted(self.marks.items(), key=lambda mark: mark[1])
+        
+        for name, started, duration, thread in phases:
+            logging.info("Startup phase {:<12} +{:8.1f} ms  {:8.1f} ms  [{}]".format(
+                name, started * 1000.0, duration * 1000.0, thread))
+        for name, elapsed in marks:
+            logging.info("Startup mark  {:<12} +{:8.1f} ms".format(name, elapsed * 1000.0))
+        
+        first_frame = self.get_mark_ms("first_frame")
+        if first_frame is not None and not self.within_budget():
+            logging.warning("Time to first frame {:.1f} ms exceeds budget of {} ms".format(
+                first_frame, config.startup.FIRST_FRAME_BUDGET_MS))
+
+
+class AssetLoader(threading.Thread):
+    def __init__(self, startup=None, leaderboard_file=None, game_config=None):
+        super().__init__(name="asset-loader", daemon=True)
+        self.startup = startup or StartupProfiler()
+        self.leaderboard_file = leaderboard_file
+        self.config = game_config or config
+        self.done = threading.Event()
+        self.error = None
+        self.font = None
+        self.big_font = None
+        self.audio_manager = None
+        self.leaderboard = None
+    
+    @property
+    def ready(self):
+        return self.done.is_set()
+    
+    def wait(self, timeout=None):
+        if not self.done.wait(timeout):
+            return False
+        if self.error is not None:
+            raise self.error
+        return True
+    
+    def run(self):
+        try:
+            self.load()
+        except Exception as e:
+            logging.error("Failed to load assets: {}".format(e), exc_info=True)
+            self.error = e
+        finally:
+            self.done.set()
+    
+    def load_fonts(self):
+        with self.startup.phase("fonts"):
+            self.font = pygame.font.Font(None, self.config.ui.FONT_SIZE_NORMAL)
+            self.big_font = pygame.font.Font(None, self.config.ui.FONT_SIZE_LARGE)
+        return self.font, self.big_font
+    
+    def load(self):
+        startup = self.startup
+        
+        with startup.phase("leaderboard"):
+            self.leaderboard = Leaderboard(
+                self.leaderboard_file, self.config.leaderboard.MAX_ENTRIES, game_config=self.config)
+        
+        with startup.phase("images"):
+            AssetCache.get().preload(self.config)
+        
+        with startup.phase("mixer"):
+            try:
+                if not pygame.mixer.get_init():
+                    pygame.mixer.init()
+            except pygame.error as e:
+                logging.error("Failed to initialize mixer: {}".format(e))
+        
+        with startup.phase("sounds"):
+            self.audio_manager = AudioManager(self.config)
+        
+        startup.mark("assets_loaded")
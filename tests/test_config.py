@@ -0,0 +1,62 @@
+from config import CollisionConfig, EnemyConfig, GameConfig
+
+
+def test_mutable_tables_are_per_instance():
+    first = GameConfig()
+    second = GameConfig()
+    
+    first.collision.HEAL['red'] = 99
+    first.collision.STRENGTH['red'] = 99
+    first.enemy.ARCHETYPES[0]['speed'] = 99
+    first.audio.PRIORITIES['die_enemy'] = 99
+    first.powerup.COLORS['blue'] = (1, 2, 3)
+    
+    assert second.collision.HEAL['red'] != 99
+    assert second.collision.STRENGTH['red'] != 99
+    assert second.enemy.ARCHETYPES[0]['speed'] != 99
+    assert second.audio.PRIORITIES['die_enemy'] != 99
+    assert second.powerup.COLORS['blue'] != (1, 2, 3)
+    assert CollisionConfig.HEAL['red'] != 99
+    assert EnemyConfig.ARCHETYPES[0]['speed'] != 99
+
+
+def test_overrides_apply_to_one_instance():
+    from balance_runner import apply_overrides, parse_overrides
+    
+    game_config = apply_overrides(parse_overrides(["spawn.RATE_BASE=70", "display.WIDTH=640"]))
+    assert game_config.spawn.RATE_BASE == 70
+    assert game_config.width == 640
+    assert GameConfig().spawn.RATE_BASE != 70
+    assert GameConfig().width != 640
+
+
+def test_powerup_colors_are_per_session():
+    from powerup import PowerUp
+    
+    first = GameConfig()
+    second = GameConfig()
+    first.powerup.COLORS['pink'] = (255, 0, 255)
+    second.powerup.COLORS['pink'] = (0, 255, 255)
+    
+    pink = PowerUp(0, 0, 'pink', first)
+    cyan = PowerUp(0, 0, 'pink', second)
+    assert pink.image.get_at((0, 0))[:3] == (255, 0, 255)
+    assert cyan.image.get_at((0, 0))[:3] == (0, 255, 255)
+
+
+def test_leaderboard_uses_session_settings(tmp_path):
+    from leaderboard import Leaderboard
+    
+    legacy = tmp_path / "legacy.txt"
+    legacy.write_text("42")
+    game_config = GameConfig()
+    game_config.leaderboard.LEGACY_FILE = str(legacy)
+    game_config.leaderboard.DEFAULT_PROFILE = "tester"
+    game_config.leaderboard.WRITE_BATCH_SECONDS = 0.0
+    
+    leaderboard = Leaderboard(str(tmp_path / "board.json"), game_config=game_config)
+    try:
+        assert leaderboard.get_high_score("tester") == 42
+        assert leaderboard.writer.batch_seconds == 0.0
+    finally:
+        leaderboard.close()
@@ -0,0 +1,36 @@
+import logging
+import random
+import main
+from input_source import RandomInput
+from replay import InputRecorder
+from save_state import load_state_file
+from simulation import HeadlessSimulation
+from timestep import FixedTimestep
+
+
+def test_crash_state_is_written_without_history(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    simulation = HeadlessSimulation(RandomInput(random.Random(5)))
+    simulation.reset(77)
+    for _ in range(120):
+        simulation.step()
+    assert simulation.game_manager.history is None
+    
+    main.save_crash_state(simulation.game_manager)
+    data = load_state_file(main.config.savestate.CRASH_STATE_FILE)
+    assert data == simulation.save_state()
+    
+    resumed = HeadlessSimulation.fork(data)
+    assert resumed.game_manager.score == simulation.game_manager.score
+
+
+def test_rewind_without_history_logs_once(caplog, monkeypatch):
+    monkeypatch.setattr(main, "_rewind_warned", False)
+    simulation = HeadlessSimulation()
+    simulation.reset(1)
+    recorder = InputRecorder(simulation.game_manager.input_source)
+    
+    with caplog.at_level(logging.INFO):
+        for _ in range(3):
+            main.rewind(simulation.game_manager, FixedTimestep(), recorder)
+    assert len([record for record in caplog.records if "Rewind needs" in record.getMessage()]) == 1
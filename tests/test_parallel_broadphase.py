@@ -0,0 +1,51 @@
+import random
+import pygame
+import pytest
+from spatial_hash import SpatialHash
+
+pytest.importorskip("numpy")
+from parallel_broadphase import ParallelBroadphase
+
+WIDTH = 800
+HEIGHT = 600
+SIZE = 30
+
+
+def random_rects(rng, count):
+    return [pygame.Rect(rng.randint(0, WIDTH - SIZE), rng.randint(0, HEIGHT - SIZE), SIZE, SIZE) for _ in range(count)]
+
+
+def wall_rects(rng, count):
+    rects = []
+    for _ in range(count):
+        side = rng.choice(["top", "bottom", "left", "right"])
+        if side == "top":
+            rects.append(pygame.Rect(rng.randint(0, WIDTH - SIZE), 0, SIZE, SIZE))
+        elif side == "bottom":
+            rects.append(pygame.Rect(rng.randint(0, WIDTH - SIZE), HEIGHT - SIZE, SIZE, SIZE))
+        elif side == "left":
+            rects.append(pygame.Rect(0, rng.randint(0, HEIGHT - SIZE), SIZE, SIZE))
+        else:
+            rects.append(pygame.Rect(WIDTH - SIZE, rng.randint(0, HEIGHT - SIZE), SIZE, SIZE))
+    return rects
+
+
+@pytest.fixture(scope="module")
+def broadphase():
+    broadphase = ParallelBroadphase(workers=3, capacity=64, result_capacity=16, start_method="spawn")
+    yield broadphase
+    broadphase.close()
+
+
+@pytest.mark.parametrize("layout", [random_rects, wall_rects])
+@pytest.mark.parametrize("count", [2, 50, 500, 3000])
+def test_parallel_pairs_match_spatial_hash(broadphase, layout, count):
+    rects = layout(random.Random(count), count)
+    expected = SpatialHash(WIDTH, HEIGHT, 64).colliding_pairs(rects)
+    assert broadphase.colliding_pairs(rects) == expected
+
+
+def test_small_result_capacity_takes_the_retry_path(broadphase):
+    broadphase.colliding_pairs(wall_rects(random.Random(1), 3000))
+    assert broadphase.retries > 0
+    assert broadphase.result_capacity > 16
@@ -0,0 +1,27 @@
+import pygame
+from profiler import FrameProfiler
+from timestep import FixedTimestep
+from config import GameConfig
+
+
+def test_overlay_uses_session_screen_size():
+    pygame.font.init()
+    game_config = GameConfig()
+    game_config.height = 400
+    profiler = FrameProfiler(True, 10, game_config)
+    profiler.toggle_overlay()
+    
+    surface = pygame.Surface((game_config.width, game_config.height))
+    profiler.begin_frame()
+    profiler.end_frame()
+    rects = profiler.draw_overlay(surface)
+    
+    assert rects
+    assert rects[0].bottom == game_config.height - game_config.ui.SCORE_MARGIN
+
+
+def test_timestep_uses_session_rate():
+    game_config = GameConfig()
+    game_config.fps = 30
+    timestep = FixedTimestep(game_config=game_config)
+    assert timestep.advance(0.1) == 3
@@ -0,0 +1,81 @@
+import copy
+import random
+import pytest
+from input_source import RandomInput
+from replay import InputRecorder, ReplayPlayer
+from save_state import HEADER, SaveStateHistory
+from simulation import HeadlessSimulation
+from config import GameConfig
+
+
+def summary(game_manager):
+    player = game_manager.get_player()
+    return (
+        game_manager.state,
+        game_manager.score,
+        game_manager.get_enemy_count(),
+        None if player is None else (player.rect.topleft, player.health),
+        sorted(game_manager.get_enemy_centers()),
+    )
+
+
+@pytest.mark.parametrize("use_store", [False, True])
+def test_rewind_then_replay_matches_live_run(use_store):
+    game_config = GameConfig()
+    game_config.enemy.USE_ARRAY_STORE = use_store
+    recorder = InputRecorder(RandomInput(random.Random(7)))
+    simulation = HeadlessSimulation(recorder, game_config=game_config)
+    game_manager = simulation.game_manager
+    game_manager.history = SaveStateHistory(600)
+    
+    simulation.reset(1234)
+    for _ in range(300):
+        assert simulation.step()
+    
+    game_manager.load_state(game_manager.history.rewind(60))
+    recorder.rewind(game_manager.score)
+    simulation.frame = game_manager.score
+    assert len(recorder.recording) == game_manager.score
+    
+    for _ in range(200):
+        if not simulation.step():
+            break
+    
+    player = ReplayPlayer(recorder.recording, game_config)
+    player.seek(len(recorder.recording))
+    assert summary(player.game_manager) == summary(game_manager)
+
+
+def test_recorder_is_not_replayable_after_detach():
+    recorder = InputRecorder(RandomInput(random.Random(7)))
+    simulation = HeadlessSimulation(recorder)
+    simulation.reset(1234)
+    recorder.detach()
+    assert not recorder.replayable
+    
+    simulation.reset(1234)
+    assert recorder.replayable
+
+
+def test_save_state_loads_across_enemy_storage_modes():
+    simulations = []
+    for use_store in (False, True):
+        game_config = GameConfig()
+        game_config.enemy.USE_ARRAY_STORE = use_store
+        simulation = HeadlessSimulation(RandomInput(random.Random(3)), game_config=game_config)
+        simulation.reset(99)
+        simulations.append(simulation)
+    
+    source, target = simulations
+    for _ in range(400):
+        source.step()
+    
+    data = source.save_state()
+    target.load_state(data)
+    assert target.save_state()[HEADER.size:] == data[HEADER.size:]
+    
+    target.game_manager.input_source = copy.deepcopy(source.game_manager.input_source)
+    for _ in range(200):
+        source.step()
+        target.step()
+    assert summary(target.game_manager) == summary(source.game_manager)
@@ -0,0 +1,47 @@
+import pygame
+import pytest
+from game_manager import GameManager
+from renderer import create_renderer
+from startup import StartupProfiler
+from config import GameConfig
+
+
+@pytest.fixture
+def startup():
+    startup = StartupProfiler()
+    with startup.phase("pygame"):
+        pygame.display.init()
+        pygame.font.init()
+    yield startup
+    pygame.quit()
+
+
+def test_first_frame_shows_menu_within_budget(startup):
+    game_config = GameConfig()
+    game_config.leaderboard.FILE = None
+    
+    with startup.phase("window"):
+        game_manager = GameManager(preload=False, game_config=game_config)
+    game_manager.load_assets(startup, background=True)
+    game_manager.state = "menu"
+    renderer = create_renderer(game_manager.screen, game_config)
+    
+    renderer.render(game_manager)
+    startup.mark("first_frame")
+    
+    assert game_manager.draw(game_manager.screen)
+    assert startup.within_budget(game_config.startup.FIRST_FRAME_BUDGET_MS)
+    
+    game_manager.poll_assets(block=True)
+    assert game_manager.assets_ready
+    assert startup.get_mark_ms("assets_loaded") is not None
+    game_manager.collision_handler.close()
+
+
+def test_within_budget_requires_first_frame():
+    startup = StartupProfiler()
+    assert not startup.within_budget(1000)
+    
+    startup.mark("first_frame")
+    assert startup.within_budget(1000)
+    assert not startup.within_budget(-1)
@@ -0,0 +1,46 @@
+import logging
+import pytest
+from config import GameConfig
+
+np = pytest.importorskip("numpy")
+from vector_env import VectorEnv
+
+
+def test_truncated_episodes_keep_their_final_observation():
+    env = VectorEnv(3, seed=10, max_frames=50)
+    env.reset()
+    actions = np.zeros(3, dtype=np.int64)
+    
+    for _ in range(49):
+        observations, rewards, dones, truncated = env.step(actions)
+        assert not dones.any()
+    
+    observations, rewards, dones, truncated = env.step(actions)
+    assert dones.all()
+    assert truncated.all()
+    assert not np.array_equal(env.final_observations, observations)
+    env.close()
+
+
+def test_deaths_are_not_truncated(caplog):
+    game_config = GameConfig()
+    game_config.player.MAX_HEALTH = 1
+    env = VectorEnv(4, seed=3, game_config=game_config)
+    env.reset()
+    rng = np.random.default_rng(0)
+    
+    with caplog.at_level(logging.INFO):
+        deaths = 0
+        for _ in range(3000):
+            observations, rewards, dones, truncated = env.step(rng.integers(0, env.action_count, size=4))
+            assert not truncated.any()
+            for i in np.flatnonzero(dones):
+                deaths += 1
+                assert rewards[i] < 0
+                assert env.final_observations[i, 2] <= 0.0
+            if deaths >= 4:
+                break
+    
+    assert deaths >= 4
+    assert not [record for record in caplog.records if "high score" in record.getMessage()]
+    env.close()
@@ -0,0 +1,71 @@
+from collections import OrderedDict
+from config import GameConfig
+
+config = GameConfig()
+
+DIGITS = "0123456789"
+
+
+class TextCache:
+    def __init__(self, max_entries=None):
+        self.max_entries = max_entries or config.ui.TEXT_CACHE_SIZE
+        self.entries = OrderedDict()
+        self.glyphs = {}
+        self.hits = 0
+        self.misses = 0
+    
+    def render(self, font, text, color):
+        key = (font, text, color)
+        surface = self.entries.get(key)
+        
+        if surface is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return surface
+        
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surface
+    
+    def _digit_glyphs(self, font, color):
+        key = (font, color)
+        glyphs = self.glyphs.get(key)
+        if glyphs is None:
+            glyphs = [font.render(digit, True, color) for digit in DIGITS]
+            self.glyphs[key] = glyphs
+        return glyphs
+    
+    def render_digits(self, font, number, color):
+        glyphs = self._digit_glyphs(font, color)
+        return [glyphs[ord(digit) - 48] for digit in str(number)]
+    
+    def draw_number(self, surface, font, label, number, color, topright):
+        label_surface = self.render(font, label, color)
+        digits = self.render_digits(font, number, color)
+        
+        width = label_surface.get_width()
+        for glyph in digits:
+            width += glyph.get_width()
+        
+        x = topright[0] - width
+        y = topright[1]
+        rect = surface.blit(label_surface, (x, y))
+        x += label_surface.get_width()
+        for glyph in digits:
+            rect.union_ip(surface.blit(glyph, (x, y)))
+            x += glyph.get_width()
+        return rect
+    
+    def clear(self):
+        self.entries.clear()
+        self.glyphs.clear()
+    
+    def get_stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self.entries),
+        }
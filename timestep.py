@@ -0,0 +1,31 @@
+from config import GameConfig
+
+config = GameConfig()
+
+
+class FixedTimestep:
+    def __init__(self, steps_per_second=None, max_steps=None, game_config=None):
+        game_config = game_config or config
+        self.step = 1.0 / (steps_per_second or game_config.fps)
+        self.max_steps = max_steps or game_config.timestep.MAX_CATCH_UP_STEPS
+        self.accumulator = 0.0
+        self.dropped_time = 0.0
+    
+    def reset(self):
+        self.accumulator = 0.0
+    
+    def advance(self, elapsed):
+        self.accumulator += elapsed
+        steps = int(self.accumulator / self.step)
+        
+        if steps > self.max_steps:
+            self.dropped_time += (steps - self.max_steps) * self.step
+            self.accumulator -= (steps - self.max_steps) * self.step
+            steps = self.max_steps
+        
+        self.accumulator -= steps * self.step
+        return steps
+    
+    @property
+    def alpha(self):
+        return min(self.accumulator / self.step, 1.0)
@@ -0,0 +1,92 @@
+from config import GameConfig
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+config = GameConfig()
+
+
+class TrackingField:
+    def __init__(self, cell_size=None, update_rate=None, game_config=None):
+        game_config = game_config or config
+        self.cell_size = cell_size or game_config.enemy.TRACKING_CELL_SIZE
+        self.update_rate = max(1, update_rate or game_config.enemy.TRACKING_UPDATE_RATE)
+        self.cols = (game_config.width + self.cell_size - 1) // self.cell_size
+        self.rows = (game_config.height + self.cell_size - 1) // self.cell_size
+        self.reset()
+    
+    def reset(self):
+        self.tick = 0
+        self.spawned = 0
+        self.player = None
+        self.center = None
+        self.cache = {}
+        self.field = None
+    
+    def begin_tick(self, player):
+        self.tick += 1
+        self.player = player
+        self.center = None
+        self.cache.clear()
+        self.field = None
+    
+    def next_phase(self):
+        phase = self.spawned % self.update_rate
+        self.spawned += 1
+        return phase
+    
+    def should_retarget(self, phase):
+        return (self.tick + phase) % self.update_rate == 0
+    
+    def _player_center(self):
+        if self.center is None and self.player is not None:
+            self.center = self.player.rect.center
+        return self.center
+    
+    def cell_of(self, x, y):
+        col = min(max(x // self.cell_size, 0), self.cols - 1)
+        row = min(max(y // self.cell_size, 0), self.rows - 1)
+        return row * self.cols + col
+    
+    def direction_at(self, x, y):
+        center = self._player_center()
+        if center is None:
+            return None
+        
+        cell = self.cell_of(x, y)
+        direction = self.cache.get(cell)
+        if direction is None:
+            half = self.cell_size // 2
+            dx = center[0] - ((cell % self.cols) * self.cell_size + half)
+            dy = center[1] - ((cell // self.cols) * self.cell_size + half)
+            
+            if abs(dx) > abs(dy):
+                direction = (1 if dx > 0 else -1, 0)
+            else:
+                direction = (0, 1 if dy > 0 else -1)
+            self.cache[cell] = direction
+        return direction
+    
+    def direction_field(self):
+        center = self._player_center()
+        if center is None:
+            return None
+        
+        if self.field is None:
+            half = self.cell_size // 2
+            cells = np.arange(self.cols * self.rows)
+            dx = center[0] - ((cells % self.cols) * self.cell_size + half)
+            dy = center[1] - ((cells // self.cols) * self.cell_size + half)
+            
+            horizontal = np.abs(dx) > np.abs(dy)
+            ux = np.where(horizontal, np.where(dx > 0, 1, -1), 0).astype(np.int32)
+            uy = np.where(horizontal, 0, np.where(dy > 0, 1, -1)).astype(np.int32)
+            self.field = (ux, uy)
+        return self.field
+    
+    def cells_of(self, xs, ys):
+        cols = np.clip(xs // self.cell_size, 0, self.cols - 1)
+        rows = np.clip(ys // self.cell_size, 0, self.rows - 1)
+        return rows * self.cols + cols
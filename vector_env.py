@@ -0,0 +1,205 @@
+import argparse
+import logging
+import sys
+import time
+from replay import decode_move
+from simulation import HeadlessSimulation
+from config import GameConfig
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+config = GameConfig()
+
+MOVES = tuple(decode_move(code) for code in range(9))
+PLAYER_FEATURES = 8
+ENEMY_FEATURES = 4
+
+
+class ActionInput:
+    def __init__(self):
+        self.move = (0, 0)
+    
+    def reset(self, game_manager):
+        self.move = (0, 0)
+    
+    def get_movement(self, game_manager):
+        return self.move
+
+
+class VectorEnv:
+    def __init__(self, num_envs, seed=None, game_config=None, nearest_enemies=None, max_frames=None):
+        if np is None:
+            raise RuntimeError("NumPy is required for the vectorized environment")
+        
+        self.config = game_config or config
+        self.num_envs = num_envs
+        self.nearest_enemies = nearest_enemies or self.config.vector_env.NEAREST_ENEMIES
+        self.max_frames = max_frames if max_frames is not None else self.config.vector_env.MAX_EPISODE_FRAMES
+        self.observation_size = PLAYER_FEATURES + ENEMY_FEATURES * self.nearest_enemies
+        self.action_count = len(MOVES)
+        
+        self.inputs = [ActionInput() for _ in range(num_envs)]
+        self.simulations = [
+            HeadlessSimulation(self.inputs[i], None if seed is None else seed + i, self.config)
+            for i in range(num_envs)
+        ]
+        self.type_scale = 1.0 / max(1, len(self.simulations[0].game_manager.archetypes) - 1)
+        
+        self.observations = np.zeros((num_envs, self.observation_size), dtype=np.float32)
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.dones = np.zeros(num_envs, dtype=bool)
+        self.truncated = np.zeros(num_envs, dtype=bool)
+        self.final_observations = np.zeros((num_envs, self.observation_size), dtype=np.float32)
+        self.episode_scores = np.zeros(num_envs, dtype=np.int64)
+        self.episode_lengths = np.zeros(num_envs, dtype=np.int64)
+        self.health = np.zeros(num_envs, dtype=np.float32)
+        self.episodes = 0
+    
+    def reset(self):
+        for i in range(self.num_envs):
+            self._reset_env(i)
+        self.rewards[:] = 0.0
+        self.dones[:] = False
+        self.truncated[:] = False
+        return self.observations
+    
+    def _reset_env(self, i):
+        simulation = self.simulations[i]
+        simulation.reset()
+        self.health[i] = simulation.game_manager.get_player().health
+        self._observe(i)
+    
+    def step(self, actions):
+        rewards = self.rewards
+        dones = self.dones
+        truncated = self.truncated
+        vector_env = self.config.vector_env
+        
+        for i, simulation in enumerate(self.simulations):
+            self.inputs[i].move = MOVES[actions[i]]
+            alive = simulation.step()
+            game_manager = simulation.game_manager
+            
+            player = game_manager.get_player()
+            health = player.health if player is not None else 0
+            rewards[i] = vector_env.REWARD_ALIVE + (health - self.health[i]) * vector_env.REWARD_HEALTH
+            self.health[i] = health
+            
+            self._observe(i)
+            if alive and (not self.max_frames or simulation.frame < self.max_frames):
+                dones[i] = False
+                truncated[i] = False
+                continue
+            
+            if not alive:
+                rewards[i] += vector_env.REWARD_DEATH
+            dones[i] = True
+            truncated[i] = alive
+            self.final_observations[i] = self.observations[i]
+            self.episode_scores[i] = game_manager.score
+            self.episode_lengths[i] = simulation.frame
+            self.episodes += 1
+            self._reset_env(i)
+        
+        return self.observations, rewards, dones, truncated
+    
+    def _enemy_state(self, game_manager):
+        enemy_store = game_manager.enemy_store
+        if enemy_store is not None:
+            n = enemy_store.count
+            half = enemy_store.size // 2
+            return enemy_store.x[:n] + half, enemy_store.y[:n] + half, enemy_store.type_id[:n]
+        
+        enemies = game_manager.registry.enemies
+        n = len(enemies)
+        xs = np.fromiter((enemy.rect.centerx for enemy in enemies), dtype=np.int32, count=n)
+        ys = np.fromiter((enemy.rect.centery for enemy in enemies), dtype=np.int32, count=n)
+        types = np.fromiter((enemy.type_id for enemy in enemies), dtype=np.uint8, count=n)
+        return xs, ys, types
+    
+    def _observe(self, i):
+        game_manager = self.simulations[i].game_manager
+        game_config = self.config
+        observation = self.observations[i]
+        player = game_manager.get_player()
+        
+        px, py = player.rect.center
+        duration = float(game_config.powerup.DURATION)
+        observation[0] = px / float(game_config.width)
+        observation[1] = py / float(game_config.height)
+        observation[2] = player.health / float(player.max_health)
+        observation[3] = player.stamina / float(player.max_stamina)
+        observation[4] = player.damage_cooldown / float(game_config.player.DAMAGE_COOLDOWN)
+        observation[5] = game_manager.red_powerup_timer / duration
+        observation[6] = game_manager.blue_powerup_timer / duration
+        observation[7] = game_manager.yellow_powerup_timer / duration
+        
+        enemies = observation[PLAYER_FEATURES:].reshape(self.nearest_enemies, ENEMY_FEATURES)
+        enemies[:] = 0.0
+        
+        xs, ys, types = self._enemy_state(game_manager)
+        if not len(xs):
+            return
+        
+        dx = xs - px
+        dy = ys - py
+        distances = dx * dx + dy * dy
+        k = self.nearest_enemies
+        if len(distances) > k:
+            nearest = np.argpartition(distances, k - 1)[:k]
+        else:
+            nearest = np.arange(len(distances))
+        nearest = nearest[np.argsort(distances[nearest], kind="stable")]
+        
+        count = len(nearest)
+        enemies[:count, 0] = dx[nearest] / float(game_config.width)
+        enemies[:count, 1] = dy[nearest] / float(game_config.height)
+        enemies[:count, 2] = types[nearest] * self.type_scale
+        enemies[:count, 3] = 1.0
+    
+    def get_stats(self):
+        return {
+            "envs": self.num_envs,
+            "episodes": self.episodes,
+            "mean_score": float(self.episode_scores.mean()),
+            "mean_length": float(self.episode_lengths.mean()),
+        }
+    
+    def close(self):
+        for simulation in self.simulations:
+            simulation.game_manager.collision_handler.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Step many headless games in lockstep with random actions.")
+    parser.add_argument("--envs", type=int, default=16)
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    
+    env = VectorEnv(args.envs, seed=args.seed)
+    rng = np.random.default_rng(args.seed)
+    env.reset()
+    
+    start = time.perf_counter()
+    for _ in range(args.steps):
+        env.step(rng.integers(0, env.action_count, size=args.envs))
+    elapsed = time.perf_counter() - start
+    env.close()
+    
+    if elapsed > 0:
+        logging.info("Stepped {} envs x {} steps in {:.2f}s ({:.0f} env steps/s)".format(
+            args.envs, args.steps, elapsed, args.envs * args.steps / elapsed))
+    logging.info("Episodes: {}".format(env.get_stats()))
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+    sys.exit(main())